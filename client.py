@@ -19,10 +19,8 @@ class ClientThread(threading.Thread):
         self.outbound_q = queue.Queue()
         self.inbound_q = queue.Queue()
 
-        self.disconnect_timer = threading.Timer(
-            AUTO_DISCONNECT_TIMEOUT,
-            self.disconnect
-        )
+        # created lazily on first send; an idle client has no timer at all
+        self.disconnect_timer = None
 
     def connect(self, mac, port):
         # create socket and connect
@@ -54,28 +52,40 @@ class ClientThread(threading.Thread):
                 time.sleep(0.02)
 
                 # reset the timer
-                self.disconnect_timer.cancel()
+                if self.disconnect_timer is not None:
+                    self.disconnect_timer.cancel()
+
                 self.disconnect_timer = threading.Timer(
                     AUTO_DISCONNECT_TIMEOUT,
                     self.disconnect
                 )
+                self.disconnect_timer.daemon = True
+                self.disconnect_timer.start()
             except queue.Empty:
                 pass
 
             # skip blocking for receiving messages, an exception will be raised if there's no data
             self.sock.setblocking(False)
 
-            # receive incoming messages
-            try:
-                self.inbound_q.put(self.sock.recv(self.receive_size))
-            except bluetooth.btcommon.BluetoothError:
-                pass
+            # receive incoming messages, draining everything that has
+            # accumulated instead of one read per loop iteration
+            while True:
+                try:
+                    data = self.sock.recv(self.receive_size)
+                except bluetooth.btcommon.BluetoothError:
+                    break
+
+                if not data:
+                    break
+
+                self.inbound_q.put(data)
 
     def disconnect(self, timeout=None):
         if self.sock:
             self.sock.close()
 
-        self.disconnect_timer.cancel()
+        if self.disconnect_timer is not None:
+            self.disconnect_timer.cancel()
 
         # unset the alive event so run() will not continue
         self.alive.clear()
@@ -1,3 +1,4 @@
+import os
 import time
 import queue
 from loguru import logger
@@ -29,7 +30,16 @@ PRINT_DATA_CHUNK = 990
 
 
 class Ivy2Printer:
-    client = ClientThread()
+    def __init__(self):
+        # Per-instance client so multiple printers can coexist and the
+        # worker thread is only created when a printer actually is
+        self.client = ClientThread()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.disconnect()
 
     def connect(self, mac_address, port=1):
         self.client.connect(mac_address, port)
@@ -44,17 +54,15 @@ class Ivy2Printer:
         return self.client.alive.is_set()
 
     def print(self, target, auto_crop=True, transfer_timeout=60):
-        image_data = bytes()
-
-        if type(target) is str:
-            image_data = image.prepare_image(target, auto_crop)
-        elif type(target) is bytes:
+        if isinstance(target, (str, os.PathLike)):
+            image_data = image.prepare_image(os.fspath(target), auto_crop)
+        elif isinstance(target, (bytes, bytearray, memoryview)):
+            # already-prepared image data passes straight through
             image_data = target
         else:
-            raise ValueError(
-                "Unsupported target; expected string or bytes but got {}".format(
-                    type(target)
-                )
+            raise TypeError(
+                "Unsupported target; expected a path or bytes-like object "
+                "but got {}".format(type(target))
             )
 
         image_length = len(image_data)
@@ -78,7 +86,8 @@ class Ivy2Printer:
 
             start_index = end_index
 
-        logger.debug("Beginning data transfer...")
+        # one line per print call, so INFO rather than DEBUG
+        logger.info("Beginning data transfer...")
 
         # wait longer than usual since the transfer takes some time
         self.__receive_message(transfer_timeout)
@@ -151,24 +160,32 @@ class Ivy2Printer:
         self.client.outbound_q.put(message)
 
     def __receive_message(self, timeout=5):
-        start = int(time.time())
-        while int(time.time()) < (start + timeout):
+        deadline = time.monotonic() + timeout
+
+        while True:
             if not self.client.alive.is_set():
                 raise ClientUnavailableError("")
 
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
             try:
-                # attempt to read the client thread's inbound queue
+                # block on the client thread's inbound queue, capping the
+                # wait so the alive flag is still checked periodically
                 response = parse_incoming_message(
-                    self.client.inbound_q.get(False, 0.1)
+                    self.client.inbound_q.get(True, min(remaining, 0.5))
                 )
-
-                logger.debug(
-                    "Received message: ack: {}, error: {}",
-                    response[2],
-                    response[3]
-                )
-                return response
             except queue.Empty:
-                pass
+                continue
+
+            # lazy so per-chunk transfer acks cost nothing unless the
+            # sink is actually at DEBUG
+            logger.opt(lazy=True).debug(
+                "Received message: ack: {}, error: {}",
+                lambda: response[2],
+                lambda: response[3]
+            )
+            return response
 
         raise ReceiveTimeoutError()
@@ -4,6 +4,9 @@ from utils import parse_bit_range
 
 START_CODE = 17167
 
+# Compiled once - avoids re-parsing the format string per message
+_BASE_MESSAGE_STRUCT = struct.Struct(">HhbHB")
+
 COMMAND_START_SESSION = 0
 COMMAND_GET_STATUS = 257
 COMMAND_SETTING_ACCESSORY = 259
@@ -26,7 +29,7 @@ class StartSessionTask(BaseTask):
     ack = ACK_START_SESSION
 
     def get_message(self):
-        return bytes(get_base_message(COMMAND_START_SESSION, True, False))
+        return _START_SESSION_MESSAGE
 
     def process_response(self, response):
         data = response[0]
@@ -41,7 +44,7 @@ class GetSettingTask(BaseTask):
     ack = ACK_SETTING_ACCESSORY
 
     def get_message(self):
-        return bytes(get_base_message(COMMAND_SETTING_ACCESSORY))
+        return _GET_SETTING_MESSAGE
 
     def process_response(self, response):
         payload = response[1]
@@ -86,7 +89,7 @@ class GetStatusTask(BaseTask):
     ack = ACK_GET_STATUS
 
     def get_message(self):
-        return bytes(get_base_message(COMMAND_GET_STATUS))
+        return _GET_STATUS_MESSAGE
 
     def process_response(self, response):
         payload = response[1]
@@ -147,8 +150,7 @@ def get_base_message(command, flag_1=False, flag_2=False):
         b2 = -1
 
     byte_array = bytearray(34)
-    struct.pack_into(
-        ">HhbHB",
+    _BASE_MESSAGE_STRUCT.pack_into(
         byte_array,
         0,
         START_CODE,
@@ -159,3 +161,9 @@ def get_base_message(command, flag_1=False, flag_2=False):
     )
 
     return byte_array
+
+
+# Messages for the parameterless tasks never change; build them once
+_START_SESSION_MESSAGE = bytes(get_base_message(COMMAND_START_SESSION, True, False))
+_GET_SETTING_MESSAGE = bytes(get_base_message(COMMAND_SETTING_ACCESSORY))
+_GET_STATUS_MESSAGE = bytes(get_base_message(COMMAND_GET_STATUS))
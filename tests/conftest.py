@@ -1,8 +1,11 @@
 """Shared pytest fixtures."""
 
 import pytest
+from io import BytesIO
 from pathlib import Path
 
+from PIL import Image
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -10,6 +13,35 @@ def fixtures_dir() -> Path:
     return Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture
+def decode_jpeg():
+    """Decode JPEG bytes into a fully loaded PIL Image.
+
+    Tests that assert on size, mode, and pixels should decode once via
+    this helper instead of repeating Image.open(BytesIO(...)) - each
+    open-plus-load is a full JPEG decode.
+    """
+    def _decode(data: bytes) -> Image.Image:
+        image = Image.open(BytesIO(data))
+        image.load()
+        return image
+
+    return _decode
+
+
+@pytest.fixture(scope="session")
+def red_jpeg(tmp_path_factory) -> str:
+    """Path to a small red JPEG, encoded once for the whole session.
+
+    Tests that only need *some* valid image file should use this
+    instead of re-encoding their own - JPEG encoding dominates the
+    runtime of tests that otherwise just exercise protocol logic.
+    """
+    path = tmp_path_factory.mktemp("images") / "red.jpg"
+    Image.new("RGB", (100, 100), "red").save(path)
+    return str(path)
+
+
 @pytest.fixture
 def test_image_path(fixtures_dir: Path) -> Path:
     """Path to a test image."""
@@ -0,0 +1,43 @@
+"""Shared helpers for tests."""
+
+from typing import Tuple
+
+
+def jpeg_size(data: bytes) -> Tuple[int, int]:
+    """Read (width, height) from an encoded JPEG without decoding it.
+
+    Walks the marker segments until the start-of-frame (SOF) header and
+    reads the 16-bit dimensions straight out of it. Tests that only
+    assert on output dimensions should use this instead of
+    Image.open(...).size followed by a load() - that path runs a full
+    DCT decode of the image just to learn two numbers.
+    """
+    sof = _find_sof(data)
+    height = int.from_bytes(data[sof + 5:sof + 7], "big")
+    width = int.from_bytes(data[sof + 7:sof + 9], "big")
+    return (width, height)
+
+
+def jpeg_sampling(data: bytes) -> Tuple[int, ...]:
+    """Read the per-component sampling factors from a JPEG's SOF header.
+
+    Returns one byte per component (high nibble horizontal, low nibble
+    vertical), e.g. (0x22, 0x11, 0x11) for 4:2:0.
+    """
+    sof = _find_sof(data)
+    components = data[sof + 9]
+    return tuple(data[sof + 10 + 3 * c + 1] for c in range(components))
+
+
+def _find_sof(data: bytes) -> int:
+    """Return the offset of the SOF marker segment."""
+    i = 2  # skip the SOI marker
+    while i + 4 <= len(data):
+        if data[i] != 0xFF:
+            break
+        marker = data[i + 1]
+        # SOF0-SOF15, excluding DHT/JPG/DAC which share the range
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            return i
+        i += 2 + int.from_bytes(data[i + 2:i + 4], "big")
+    raise ValueError("No SOF marker found in JPEG data")
@@ -4,14 +4,18 @@ Tests the full flow of printer operations using MockTransport
 to simulate printer responses.
 """
 
+import functools
+
 import pytest
 import struct
 
 from tests.mocks import MockTransport
 from zinkwell.devices.canon_ivy2 import CanonIvy2Printer
 from zinkwell.devices.canon_ivy2.protocol import (
-    START_CODE,
     PACKET_SIZE,
+    COMMAND_START_SESSION,
+    COMMAND_GET_STATUS,
+    COMMAND_SETTING_ACCESSORY,
     ACK_START_SESSION,
     ACK_GET_STATUS,
     ACK_SETTING_ACCESSORY,
@@ -21,34 +25,33 @@ from zinkwell.exceptions import (
     LowBatteryError,
     CoverOpenError,
     NoPaperError,
+    PrintError,
     ProtocolError,
 )
 
 
+# Response header: 5 pad bytes, ACK (bytes 5-6, big endian), error (byte 7)
+_RESPONSE_HEADER = struct.Struct(">5xHB")
+
+# Session response: zero ACK, battery at byte 10, MTU at bytes 11-12
+_SESSION_RESPONSE = struct.Struct(">10xBH21x")
+
+
+# The builders are pure and called with a handful of distinct argument
+# combinations, so each unique response is assembled once per run
+@functools.lru_cache(maxsize=128)
 def build_response(ack: int, error: int = 0, payload: bytes = b"") -> bytes:
     """Build a 34-byte response message."""
-    data = bytearray(PACKET_SIZE)
-    # ACK at bytes 5-6 (big endian)
-    data[5] = (ack >> 8) & 0xFF
-    data[6] = ack & 0xFF
-    # Error at byte 7
-    data[7] = error
-    # Payload starting at byte 8
-    if payload:
-        data[8:8 + len(payload)] = payload[:PACKET_SIZE - 8]
-    return bytes(data)
+    # Assembled directly as immutable bytes - no mutable scratch buffer
+    # that would need a final copy
+    body = bytes(payload[:PACKET_SIZE - 8])
+    return _RESPONSE_HEADER.pack(ack, error) + body + bytes(PACKET_SIZE - 8 - len(body))
 
 
+@functools.lru_cache(maxsize=32)
 def build_session_response(battery: int = 80, mtu: int = 512) -> bytes:
     """Build a session start response with battery and MTU."""
-    data = bytearray(PACKET_SIZE)
-    data[5] = 0  # ACK high
-    data[6] = 0  # ACK low = 0 (ACK_START_SESSION)
-    data[9] = 0
-    data[10] = battery  # Battery in lower bits
-    data[11] = (mtu >> 8) & 0xFF  # MTU high
-    data[12] = mtu & 0xFF  # MTU low
-    return bytes(data)
+    return _SESSION_RESPONSE.pack(battery, mtu)
 
 
 def build_status_response(
@@ -98,6 +101,7 @@ def build_settings_response(
     return build_response(ACK_SETTING_ACCESSORY, payload=bytes(payload))
 
 
+@functools.lru_cache(maxsize=32)
 def build_print_ready_response() -> bytes:
     """Build a print ready response."""
     payload = bytearray(10)
@@ -106,50 +110,55 @@ def build_print_ready_response() -> bytes:
     return build_response(ACK_PRINT_READY, payload=bytes(payload))
 
 
-def get_command_prefix(command: int) -> bytes:
-    """Get the 8-byte prefix for a command message."""
-    msg = bytearray(8)
-    struct.pack_into(">H", msg, 0, START_CODE)
-    struct.pack_into(">hb", msg, 2, 1, 32)  # Default flags
-    struct.pack_into(">H", msg, 5, command)
-    return bytes(msg)
+# Default session response, shared by every test that doesn't care
+# about the handshake values
+SESSION_RESPONSE_DEFAULT = build_session_response()
 
 
-class TestCanonIvy2Connection:
-    """Tests for connection flow."""
+@pytest.fixture
+def make_printer():
+    """Factory for connected printers backed by a MockTransport.
 
-    def test_connect_establishes_session(self):
-        """Connect should establish session and get battery/MTU."""
-        # Session init uses flag_1=True which sets different header
-        session_prefix = bytearray(8)
-        struct.pack_into(">H", session_prefix, 0, START_CODE)
-        struct.pack_into(">hb", session_prefix, 2, -1, -1)  # flag_1=True
-        struct.pack_into(">H", session_prefix, 5, 0)  # COMMAND_START_SESSION
-
-        mock = MockTransport(responses={
-            bytes(session_prefix): build_session_response(battery=75, mtu=1024),
-        })
+    Returns a callable taking the per-test response dict; the default
+    session response is merged in (and can be overridden by passing a
+    COMMAND_START_SESSION entry). Every printer created is disconnected
+    at teardown, so tests don't repeat the connect/disconnect
+    boilerplate.
+    """
+    printers = []
 
+    def _make(extra_responses=None):
+        responses = {COMMAND_START_SESSION: SESSION_RESPONSE_DEFAULT}
+        if extra_responses:
+            responses.update(extra_responses)
+
+        mock = MockTransport(responses=responses)
         printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
         printer.connect()
+        printers.append(printer)
+        return printer, mock
 
-        assert printer.is_connected
-        assert len(mock.sent_commands) == 1
+    yield _make
+
+    for printer in printers:
         printer.disconnect()
 
-    def test_disconnect_cleans_up(self):
-        """Disconnect should clean up client."""
-        session_prefix = bytearray(8)
-        struct.pack_into(">H", session_prefix, 0, START_CODE)
-        struct.pack_into(">hb", session_prefix, 2, -1, -1)
-        struct.pack_into(">H", session_prefix, 5, 0)
 
-        mock = MockTransport(responses={
-            bytes(session_prefix): build_session_response(),
+class TestCanonIvy2Connection:
+    """Tests for connection flow."""
+
+    def test_connect_establishes_session(self, make_printer):
+        """Connect should establish session and get battery/MTU."""
+        printer, mock = make_printer({
+            COMMAND_START_SESSION: build_session_response(battery=75, mtu=1024),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
+        assert printer.is_connected
+        assert len(mock.sent_commands) == 1
+
+    def test_disconnect_cleans_up(self, make_printer):
+        """Disconnect should clean up client."""
+        printer, _ = make_printer()
         assert printer.is_connected
 
         printer.disconnect()
@@ -159,343 +168,156 @@ class TestCanonIvy2Connection:
 class TestCanonIvy2Status:
     """Tests for get_status flow."""
 
-    def setup_method(self):
-        """Set up printer with mock transport for status tests."""
-        # Session prefix
-        self.session_prefix = bytearray(8)
-        struct.pack_into(">H", self.session_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.session_prefix, 2, -1, -1)
-        struct.pack_into(">H", self.session_prefix, 5, 0)
-
-        # Status prefix - command 257 = 0x0101
-        self.status_prefix = bytearray(8)
-        struct.pack_into(">H", self.status_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.status_prefix, 2, 1, 32)
-        struct.pack_into(">H", self.status_prefix, 5, 257)
-
-    def test_get_status_returns_battery(self):
+    def test_get_status_returns_battery(self, make_printer):
         """get_status should return battery level."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(battery=50),
+        printer, _ = make_printer({
+            COMMAND_GET_STATUS: build_status_response(battery=50),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         status = printer.get_status()
 
         assert status.battery_level == 50  # parse_bit_range extracts 6 LSBs of 50 = 50
         assert status.is_ready  # No errors, battery >= 30%
-        printer.disconnect()
 
-    def test_get_status_cover_open(self):
+    def test_get_status_cover_open(self, make_printer):
         """get_status should detect cover open."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(cover_open=True),
+        printer, _ = make_printer({
+            COMMAND_GET_STATUS: build_status_response(cover_open=True),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         status = printer.get_status()
 
         assert status.is_cover_open
         assert not status.is_ready
         assert status.error == "Cover is open"
-        printer.disconnect()
 
-    def test_get_status_no_paper(self):
+    def test_get_status_no_paper(self, make_printer):
         """get_status should detect no paper."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(no_paper=True),
+        printer, _ = make_printer({
+            COMMAND_GET_STATUS: build_status_response(no_paper=True),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         status = printer.get_status()
 
         assert not status.is_ready
         assert status.error == "No paper"
-        printer.disconnect()
-
 
-class TestCanonIvy2PrintChecks:
-    """Tests for pre-print validation."""
-
-    def setup_method(self):
-        """Set up command prefixes."""
-        self.session_prefix = bytearray(8)
-        struct.pack_into(">H", self.session_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.session_prefix, 2, -1, -1)
-        struct.pack_into(">H", self.session_prefix, 5, 0)
-
-        self.status_prefix = bytearray(8)
-        struct.pack_into(">H", self.status_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.status_prefix, 2, 1, 32)
-        struct.pack_into(">H", self.status_prefix, 5, 257)
-
-    def test_print_rejects_cover_open(self, tmp_path):
-        """Print should raise CoverOpenError if cover is open."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(cover_open=True),
-        })
 
-        # Create a test image
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
+# Status conditions that must reject a print, and the exception each
+# one raises
+_PRINT_FAILURE_CASES = [
+    (dict(cover_open=True), CoverOpenError, None),
+    (dict(no_paper=True), NoPaperError, None),
+    (dict(wrong_sheet=True), PrintError, "Wrong smart sheet"),
+    (dict(error_code=99), PrintError, None),
+]
 
-        with pytest.raises(CoverOpenError):
-            printer.print(str(img_path))
 
-        printer.disconnect()
+class TestCanonIvy2PrintChecks:
+    """Tests for pre-print validation."""
 
-    def test_print_rejects_no_paper(self, tmp_path):
-        """Print should raise NoPaperError if no paper."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(no_paper=True),
+    @pytest.mark.parametrize("status_kwargs,expected_exc,match", _PRINT_FAILURE_CASES)
+    def test_print_rejects_bad_status(
+        self, make_printer, red_jpeg, status_kwargs, expected_exc, match
+    ):
+        """Print should raise the matching error for each bad status."""
+        printer, _ = make_printer({
+            COMMAND_GET_STATUS: build_status_response(**status_kwargs),
         })
 
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
-        with pytest.raises(NoPaperError):
-            printer.print(str(img_path))
+        with pytest.raises(expected_exc, match=match):
+            printer.print(red_jpeg)
 
-        printer.disconnect()
-
-    def test_print_rejects_low_battery(self, tmp_path):
+    def test_print_rejects_low_battery(self, make_printer, red_jpeg):
         """Print should raise LowBatteryError if battery below 30%."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(battery=20),
+        printer, _ = make_printer({
+            COMMAND_START_SESSION: build_session_response(battery=20),
             # Status response with battery < 30% encoded
-            bytes(self.status_prefix): build_status_response(battery=20),
+            COMMAND_GET_STATUS: build_status_response(battery=20),
         })
 
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         with pytest.raises(LowBatteryError):
-            printer.print(str(img_path))
-
-        printer.disconnect()
+            printer.print(red_jpeg)
 
 
 class TestCanonIvy2Settings:
     """Tests for settings flow."""
 
-    def setup_method(self):
-        """Set up command prefixes."""
-        self.session_prefix = bytearray(8)
-        struct.pack_into(">H", self.session_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.session_prefix, 2, -1, -1)
-        struct.pack_into(">H", self.session_prefix, 5, 0)
-
-        # Settings prefix - command 259
-        self.settings_prefix = bytearray(8)
-        struct.pack_into(">H", self.settings_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.settings_prefix, 2, 1, 32)
-        struct.pack_into(">H", self.settings_prefix, 5, 259)
-
-    def test_get_settings_returns_firmware(self):
+    def test_get_settings_returns_firmware(self, make_printer):
         """get_settings should return firmware version."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.settings_prefix): build_settings_response(
+        printer, _ = make_printer({
+            COMMAND_SETTING_ACCESSORY: build_settings_response(
                 auto_off=10, firmware=(2, 1, 5), photos=100
             ),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         settings = printer.get_settings()
 
         assert settings["firmware_version"] == "2.1.5"
         assert settings["auto_power_off"] == 10
         assert settings["photos_printed"] == 100
-        printer.disconnect()
 
-    def test_set_setting_auto_power_off(self):
+    def test_set_setting_auto_power_off(self, make_printer):
         """set_setting should send auto_power_off value."""
-        # Set setting uses flag_2=True which changes the header
-        set_settings_prefix = bytearray(8)
-        struct.pack_into(">H", set_settings_prefix, 0, START_CODE)
-        struct.pack_into(">hb", set_settings_prefix, 2, 1, 32)
-        struct.pack_into(">HB", set_settings_prefix, 5, 259, 1)  # flag_2=True adds 1
-
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(set_settings_prefix): build_response(ACK_SETTING_ACCESSORY),
+        printer, mock = make_printer({
+            COMMAND_SETTING_ACCESSORY: build_response(ACK_SETTING_ACCESSORY),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         printer.set_setting("auto_power_off", 5)
 
         # Verify command was sent
         assert len(mock.sent_commands) == 2  # session + set_setting
-        printer.disconnect()
 
-    def test_set_setting_invalid_key_raises(self):
+    def test_set_setting_invalid_key_raises(self, make_printer):
         """set_setting with unknown key should raise ValueError."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-        })
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
+        printer, _ = make_printer()
 
         with pytest.raises(ValueError) as exc_info:
             printer.set_setting("unknown_setting", 5)
 
         assert "Unknown setting" in str(exc_info.value)
-        printer.disconnect()
 
-    def test_set_setting_invalid_value_raises(self):
+    def test_set_setting_invalid_value_raises(self, make_printer):
         """set_setting with invalid value should raise ValueError."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-        })
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
+        printer, _ = make_printer()
 
         with pytest.raises(ValueError) as exc_info:
             printer.set_setting("auto_power_off", 7)  # Must be 3, 5, or 10
 
         assert "must be 3, 5, or 10" in str(exc_info.value)
-        printer.disconnect()
 
 
 class TestCanonIvy2ErrorHandling:
     """Tests for error handling paths."""
 
-    def setup_method(self):
-        """Set up command prefixes."""
-        self.session_prefix = bytearray(8)
-        struct.pack_into(">H", self.session_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.session_prefix, 2, -1, -1)
-        struct.pack_into(">H", self.session_prefix, 5, 0)
-
-        self.status_prefix = bytearray(8)
-        struct.pack_into(">H", self.status_prefix, 0, START_CODE)
-        struct.pack_into(">hb", self.status_prefix, 2, 1, 32)
-        struct.pack_into(">H", self.status_prefix, 5, 257)
-
-    def test_wrong_smart_sheet_error(self, tmp_path):
-        """Print should raise PrintError for wrong smart sheet."""
-        from zinkwell.exceptions import PrintError
-
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(wrong_sheet=True),
-        })
-
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
-        with pytest.raises(PrintError) as exc_info:
-            printer.print(str(img_path))
-
-        assert "Wrong smart sheet" in str(exc_info.value)
-        printer.disconnect()
-
-    def test_status_with_error_code(self):
+    def test_status_with_error_code(self, make_printer):
         """get_status should report error codes."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(error_code=42),
+        printer, _ = make_printer({
+            COMMAND_GET_STATUS: build_status_response(error_code=42),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         status = printer.get_status()
 
         assert status.error == "Error code: 42"
         assert not status.is_ready
-        printer.disconnect()
 
-    def test_protocol_error_wrong_ack(self):
+    def test_protocol_error_wrong_ack(self, make_printer):
         """Protocol error should be raised for unexpected ACK."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_response(ack=9999),  # Wrong ACK
+        printer, _ = make_printer({
+            COMMAND_GET_STATUS: build_response(ack=9999),  # Wrong ACK
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         with pytest.raises(ProtocolError) as exc_info:
             printer.get_status()
 
         assert "Unexpected ACK" in str(exc_info.value)
-        printer.disconnect()
-
-    def test_print_with_generic_error(self, tmp_path):
-        """Print should raise PrintError for generic status errors."""
-        from zinkwell.exceptions import PrintError
-
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(self.status_prefix): build_status_response(error_code=99),
-        })
-
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
 
-        with pytest.raises(PrintError):
-            printer.print(str(img_path))
-
-        printer.disconnect()
-
-    def test_info_includes_firmware_after_get_settings(self):
+    def test_info_includes_firmware_after_get_settings(self, make_printer):
         """Printer info should include firmware version after get_settings."""
-        settings_prefix = bytearray(8)
-        struct.pack_into(">H", settings_prefix, 0, START_CODE)
-        struct.pack_into(">hb", settings_prefix, 2, 1, 32)
-        struct.pack_into(">H", settings_prefix, 5, 259)
-
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-            bytes(settings_prefix): build_settings_response(firmware=(3, 2, 1)),
+        printer, _ = make_printer({
+            COMMAND_SETTING_ACCESSORY: build_settings_response(firmware=(3, 2, 1)),
         })
 
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         # Before get_settings, firmware is None
         assert printer.info.firmware_version is None
 
@@ -503,20 +325,13 @@ class TestCanonIvy2ErrorHandling:
 
         # After get_settings, firmware is populated
         assert printer.info.firmware_version == "3.2.1"
-        printer.disconnect()
 
-    def test_capabilities_property(self):
+    def test_capabilities_property(self, make_printer):
         """Printer should expose capabilities."""
-        mock = MockTransport(responses={
-            bytes(self.session_prefix): build_session_response(),
-        })
-
-        printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
+        printer, _ = make_printer()
 
         caps = printer.capabilities
 
         assert caps.can_get_status is True
         assert caps.can_reboot is True
         assert caps.min_battery_for_print == 30
-        printer.disconnect()
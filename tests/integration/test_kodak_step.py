@@ -4,6 +4,9 @@ Tests the full flow of printer operations using MockTransport
 to simulate printer responses.
 """
 
+import functools
+import struct
+
 import pytest
 
 from tests.mocks import MockTransport
@@ -30,381 +33,238 @@ from zinkwell.exceptions import (
 )
 
 
+# Response shapes, compiled once: header at 0-3, command at byte 6,
+# value/error at byte 8, plus per-shape extras
+_RESPONSE = struct.Struct(">4s4xB3xB21x")       # error @8, battery @12
+_CMD_RESPONSE = struct.Struct(">4s2xBxB25x")    # command @6, value @8
+_ACC_RESPONSE = struct.Struct(">4s2xBxB3xB21x")  # command @6, error @8, battery @12
+_COUNT_RESPONSE = struct.Struct(">4s2xBBH24x")  # command @6, flag @7, count @8-9
+
+
+# Pure builders over tiny argument spaces - memoized so each distinct
+# packet is assembled once per run, and packed straight to immutable
+# bytes with no mutable scratch buffer
+@functools.lru_cache(maxsize=None)
 def build_response(error_code: int = ERR_SUCCESS, battery: int = 80) -> bytes:
     """Build a 34-byte response message."""
-    data = bytearray(PACKET_SIZE)
-    data[0:4] = HEADER
-    data[8] = error_code
-    data[12] = battery  # Battery level for GET_ACCESSORY_INFO
-    return bytes(data)
+    return _RESPONSE.pack(HEADER, error_code, battery)
 
 
+@functools.lru_cache(maxsize=None)
 def build_accessory_info_response(battery: int = 80) -> bytes:
     """Build an accessory info response with battery level."""
-    data = bytearray(PACKET_SIZE)
-    data[0:4] = HEADER
-    data[6] = CMD_GET_ACCESSORY_INFO
-    data[8] = ERR_SUCCESS
-    data[12] = battery
-    return bytes(data)
+    return _ACC_RESPONSE.pack(HEADER, CMD_GET_ACCESSORY_INFO, ERR_SUCCESS, battery)
 
 
+@functools.lru_cache(maxsize=None)
 def build_battery_level_response(is_charging: bool = False) -> bytes:
     """Build a battery level (charging status) response."""
-    data = bytearray(PACKET_SIZE)
-    data[0:4] = HEADER
-    data[6] = CMD_GET_BATTERY_LEVEL
-    data[8] = 1 if is_charging else 0
-    return bytes(data)
+    return _CMD_RESPONSE.pack(HEADER, CMD_GET_BATTERY_LEVEL, 1 if is_charging else 0)
 
 
+@functools.lru_cache(maxsize=None)
 def build_page_type_response(error_code: int = ERR_SUCCESS) -> bytes:
     """Build a page type response."""
-    data = bytearray(PACKET_SIZE)
-    data[0:4] = HEADER
-    data[6] = CMD_GET_PAGE_TYPE
-    data[8] = error_code
-    return bytes(data)
+    return _CMD_RESPONSE.pack(HEADER, CMD_GET_PAGE_TYPE, error_code)
 
 
+@functools.lru_cache(maxsize=None)
 def build_print_ready_response(error_code: int = ERR_SUCCESS) -> bytes:
     """Build a print ready response."""
-    data = bytearray(PACKET_SIZE)
-    data[0:4] = HEADER
-    data[6] = CMD_PRINT_READY
-    data[8] = error_code
-    return bytes(data)
+    return _CMD_RESPONSE.pack(HEADER, CMD_PRINT_READY, error_code)
 
 
+@functools.lru_cache(maxsize=None)
 def build_auto_power_off_response(minutes: int = 5) -> bytes:
     """Build an auto power off response."""
-    data = bytearray(PACKET_SIZE)
-    data[0:4] = HEADER
-    data[6] = CMD_GET_AUTO_POWER_OFF
-    data[8] = minutes
-    return bytes(data)
+    return _CMD_RESPONSE.pack(HEADER, CMD_GET_AUTO_POWER_OFF, minutes)
 
 
+@functools.lru_cache(maxsize=None)
 def build_print_count_response(count: int = 100) -> bytes:
     """Build a print count response."""
-    data = bytearray(PACKET_SIZE)
-    data[0:4] = HEADER
-    data[6] = CMD_PRINT_READY
-    data[7] = 0x01  # Flag for print count
-    data[8] = (count >> 8) & 0xFF
-    data[9] = count & 0xFF
-    return bytes(data)
-
-
-def get_accessory_info_prefix(is_slim: bool = False) -> bytes:
-    """Get the 8-byte prefix for GET_ACCESSORY_INFO command."""
-    prefix = bytearray(8)
-    prefix[0:4] = HEADER
-    prefix[4] = 0x00
-    prefix[5] = FLAG_SLIM_DEVICE if is_slim else FLAG_STANDARD_DEVICE
-    prefix[6] = CMD_GET_ACCESSORY_INFO
-    prefix[7] = 0x00
-    return bytes(prefix)
-
-
-def get_battery_level_prefix() -> bytes:
-    """Get the 8-byte prefix for GET_BATTERY_LEVEL command."""
-    prefix = bytearray(8)
-    prefix[0:4] = HEADER
-    prefix[4] = 0x00
-    prefix[5] = 0x00
-    prefix[6] = CMD_GET_BATTERY_LEVEL
-    prefix[7] = 0x00
-    return bytes(prefix)
-
-
-def get_page_type_prefix() -> bytes:
-    """Get the 8-byte prefix for GET_PAGE_TYPE command."""
-    prefix = bytearray(8)
-    prefix[0:4] = HEADER
-    prefix[4] = 0x00
-    prefix[5] = 0x00
-    prefix[6] = CMD_GET_PAGE_TYPE
-    prefix[7] = 0x00
-    return bytes(prefix)
-
-
-def get_auto_power_off_prefix() -> bytes:
-    """Get the 8-byte prefix for GET_AUTO_POWER_OFF command."""
-    prefix = bytearray(8)
-    prefix[0:4] = HEADER
-    prefix[4] = 0x00
-    prefix[5] = 0x00
-    prefix[6] = CMD_GET_AUTO_POWER_OFF
-    prefix[7] = 0x00
-    return bytes(prefix)
-
-
-def get_print_count_prefix() -> bytes:
-    """Get the 8-byte prefix for GET_PRINT_COUNT command."""
-    prefix = bytearray(8)
-    prefix[0:4] = HEADER
-    prefix[4] = 0x00
-    prefix[5] = 0x00
-    prefix[6] = CMD_PRINT_READY
-    prefix[7] = 0x01  # Flag that distinguishes from PRINT_READY
-    return bytes(prefix)
+    return _COUNT_RESPONSE.pack(HEADER, CMD_PRINT_READY, 0x01, count)
+
+
+# Int response keys for MockTransport, matched against bytes 5-6 of
+# each outbound frame: the device-type flag and the command code. The
+# print-count request reuses CMD_PRINT_READY (distinguished on the wire
+# only by flags3), so no test registers both at once.
+ACC_INFO_KEY = (FLAG_STANDARD_DEVICE << 8) | CMD_GET_ACCESSORY_INFO
+ACC_INFO_KEY_SLIM = (FLAG_SLIM_DEVICE << 8) | CMD_GET_ACCESSORY_INFO
+BATTERY_KEY = CMD_GET_BATTERY_LEVEL
+PAGE_TYPE_KEY = CMD_GET_PAGE_TYPE
+AUTO_POWER_OFF_KEY = CMD_GET_AUTO_POWER_OFF
+PRINT_COUNT_KEY = CMD_PRINT_READY
+
+# Default accessory-info response, shared by every test that doesn't
+# care about the handshake values
+ACC_INFO_RESPONSE_DEFAULT = build_accessory_info_response()
+
+
+@pytest.fixture
+def make_printer():
+    """Factory for connected printers backed by a MockTransport.
+
+    Returns a callable taking the per-test response dict and any
+    KodakStepPrinter keyword arguments; the default accessory-info
+    response is merged in. Every printer created is disconnected at
+    teardown, so tests don't repeat the connect/disconnect boilerplate.
+    """
+    printers = []
+
+    def _make(extra_responses=None, **printer_kwargs):
+        responses = {ACC_INFO_KEY: ACC_INFO_RESPONSE_DEFAULT}
+        if extra_responses:
+            responses.update(extra_responses)
+
+        mock = MockTransport(responses=responses)
+        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock, **printer_kwargs)
+        printer.connect()
+        printers.append(printer)
+        return printer, mock
+
+    yield _make
+
+    for printer in printers:
+        printer.disconnect()
 
 
 class TestKodakStepConnection:
     """Tests for connection flow."""
 
-    def test_connect_establishes_session(self):
+    def test_connect_establishes_session(self, make_printer):
         """Connect should establish session and get battery."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=75),
+        printer, mock = make_printer({
+            ACC_INFO_KEY: build_accessory_info_response(battery=75),
         })
 
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
         assert printer.is_connected
         assert len(mock.sent_commands) == 1
-        printer.disconnect()
 
-    def test_connect_slim_device(self):
+    def test_connect_slim_device(self, make_printer):
         """Connect should use slim variant for Step Slim."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(is_slim=True): build_accessory_info_response(battery=75),
-        })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock, is_slim=True)
-        printer.connect()
+        printer, mock = make_printer({
+            ACC_INFO_KEY_SLIM: build_accessory_info_response(battery=75),
+        }, is_slim=True)
 
         assert printer.is_connected
         # Verify slim flag was used
         sent_cmd = mock.sent_commands[0]
         assert sent_cmd[5] == FLAG_SLIM_DEVICE
-        printer.disconnect()
 
-    def test_disconnect_cleans_up(self):
+    def test_disconnect_cleans_up(self, make_printer):
         """Disconnect should clean up client."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(),
-        })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
+        printer, _ = make_printer()
         assert printer.is_connected
 
         printer.disconnect()
         assert not printer.is_connected
 
 
-class TestKodakStepStatus:
-    """Tests for get_status flow."""
-
-    def test_get_status_returns_battery(self):
-        """get_status should return battery level."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=65),
-            get_battery_level_prefix(): build_battery_level_response(is_charging=False),
-            get_page_type_prefix(): build_page_type_response(ERR_SUCCESS),
-        })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-        mock.clear()
+# Status scenarios: accessory battery, charging flag, page-type error,
+# and the PrinterStatus attributes each one must produce
+_STATUS_CASES = [
+    (65, False, ERR_SUCCESS, dict(battery_level=65, is_ready=True)),
+    (50, True, ERR_SUCCESS, dict(is_charging=True)),
+    (80, False, ERR_COVER_OPEN,
+     dict(is_cover_open=True, is_ready=False, error="Cover is open")),
+    (80, False, ERR_NO_PAPER, dict(is_ready=False, error="No paper")),
+]
 
-        status = printer.get_status()
 
-        assert status.battery_level == 65
-        assert status.is_ready
-        printer.disconnect()
+class TestKodakStepStatus:
+    """Tests for get_status flow."""
 
-    def test_get_status_charging(self):
-        """get_status should detect charging status."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=50),
-            get_battery_level_prefix(): build_battery_level_response(is_charging=True),
-            get_page_type_prefix(): build_page_type_response(ERR_SUCCESS),
+    @pytest.mark.parametrize("battery,is_charging,page_err,expected", _STATUS_CASES)
+    def test_get_status(self, make_printer, battery, is_charging, page_err, expected):
+        """get_status should decode each response combination."""
+        printer, mock = make_printer({
+            ACC_INFO_KEY: build_accessory_info_response(battery=battery),
+            BATTERY_KEY: build_battery_level_response(is_charging=is_charging),
+            PAGE_TYPE_KEY: build_page_type_response(page_err),
         })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
         mock.clear()
 
         status = printer.get_status()
 
-        assert status.is_charging is True
-        printer.disconnect()
+        for attr, value in expected.items():
+            assert getattr(status, attr) == value
 
-    def test_get_status_cover_open(self):
-        """get_status should detect cover open."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=80),
-            get_battery_level_prefix(): build_battery_level_response(),
-            get_page_type_prefix(): build_page_type_response(ERR_COVER_OPEN),
-        })
 
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-        mock.clear()
-
-        status = printer.get_status()
-
-        assert status.is_cover_open
-        assert not status.is_ready
-        assert status.error == "Cover is open"
-        printer.disconnect()
-
-    def test_get_status_no_paper(self):
-        """get_status should detect no paper."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=80),
-            get_battery_level_prefix(): build_battery_level_response(),
-            get_page_type_prefix(): build_page_type_response(ERR_NO_PAPER),
-        })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-        mock.clear()
-
-        status = printer.get_status()
-
-        assert not status.is_ready
-        assert status.error == "No paper"
-        printer.disconnect()
+# Printer states that must reject a print: page-type error, accessory
+# battery level, and the exception each combination raises
+_PRINT_FAILURE_CASES = [
+    (ERR_COVER_OPEN, 80, CoverOpenError),
+    (ERR_NO_PAPER, 80, NoPaperError),
+    (ERR_SUCCESS, 20, LowBatteryError),
+]
 
 
 class TestKodakStepPrintChecks:
     """Tests for pre-print validation."""
 
-    def test_print_rejects_cover_open(self, tmp_path):
-        """Print should raise CoverOpenError if cover is open."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=80),
-            get_battery_level_prefix(): build_battery_level_response(),
-            get_page_type_prefix(): build_page_type_response(ERR_COVER_OPEN),
+    @pytest.mark.parametrize("page_err,battery,expected_exc", _PRINT_FAILURE_CASES)
+    def test_print_rejects_bad_status(
+        self, make_printer, red_jpeg, page_err, battery, expected_exc
+    ):
+        """Print should raise the matching error for each bad status."""
+        printer, _ = make_printer({
+            ACC_INFO_KEY: build_accessory_info_response(battery=battery),
+            BATTERY_KEY: build_battery_level_response(),
+            PAGE_TYPE_KEY: build_page_type_response(page_err),
         })
 
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
-        with pytest.raises(CoverOpenError):
-            printer.print(str(img_path))
-
-        printer.disconnect()
-
-    def test_print_rejects_no_paper(self, tmp_path):
-        """Print should raise NoPaperError if no paper."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=80),
-            get_battery_level_prefix(): build_battery_level_response(),
-            get_page_type_prefix(): build_page_type_response(ERR_NO_PAPER),
-        })
-
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
-        with pytest.raises(NoPaperError):
-            printer.print(str(img_path))
-
-        printer.disconnect()
-
-    def test_print_rejects_low_battery(self, tmp_path):
-        """Print should raise LowBatteryError if battery below 30%."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(battery=20),
-            get_battery_level_prefix(): build_battery_level_response(),
-            get_page_type_prefix(): build_page_type_response(ERR_SUCCESS),
-        })
-
-        from PIL import Image
-        img_path = tmp_path / "test.jpg"
-        img = Image.new("RGB", (100, 100), "red")
-        img.save(img_path)
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
-
-        with pytest.raises(LowBatteryError):
-            printer.print(str(img_path))
-
-        printer.disconnect()
+        with pytest.raises(expected_exc):
+            printer.print(red_jpeg)
 
 
 class TestKodakStepSettings:
     """Tests for settings flow."""
 
-    def test_get_settings_returns_values(self):
+    def test_get_settings_returns_values(self, make_printer):
         """get_settings should return auto power off and print count."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(),
-            get_auto_power_off_prefix(): build_auto_power_off_response(minutes=10),
-            get_print_count_prefix(): build_print_count_response(count=250),
+        printer, mock = make_printer({
+            AUTO_POWER_OFF_KEY: build_auto_power_off_response(minutes=10),
+            PRINT_COUNT_KEY: build_print_count_response(count=250),
         })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
         mock.clear()
 
         settings = printer.get_settings()
 
         assert settings["auto_power_off"] == 10
         assert settings["print_count"] == 250
-        printer.disconnect()
 
 
 class TestKodakStepInfo:
     """Tests for printer info."""
 
-    def test_info_standard_device(self):
+    def test_info_standard_device(self, make_printer):
         """Info should show standard device name."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(),
-        })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock, is_slim=False)
-        printer.connect()
+        printer, _ = make_printer(is_slim=False)
 
         info = printer.info
 
         assert info.name == "Kodak Step"
         assert info.model == "kodak_step"
-        printer.disconnect()
 
-    def test_info_slim_device(self):
+    def test_info_slim_device(self, make_printer):
         """Info should show slim device name."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(is_slim=True): build_accessory_info_response(),
-        })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock, is_slim=True)
-        printer.connect()
+        printer, _ = make_printer({
+            ACC_INFO_KEY_SLIM: build_accessory_info_response(),
+        }, is_slim=True)
 
         info = printer.info
 
         assert info.name == "Kodak Step Slim"
-        printer.disconnect()
 
 
 class TestKodakStepCapabilities:
     """Tests for printer capabilities."""
 
-    def test_capabilities_property(self):
+    def test_capabilities_property(self, make_printer):
         """Printer should expose capabilities."""
-        mock = MockTransport(responses={
-            get_accessory_info_prefix(): build_accessory_info_response(),
-        })
-
-        printer = KodakStepPrinter("AA:BB:CC:DD:EE:FF", transport=mock)
-        printer.connect()
+        printer, _ = make_printer()
 
         caps = printer.capabilities
 
@@ -414,4 +274,3 @@ class TestKodakStepCapabilities:
         assert caps.can_reboot is False
         assert caps.supports_multiple_copies is True
         assert caps.min_battery_for_print == 30
-        printer.disconnect()
@@ -1,6 +1,7 @@
 """Mock implementations for testing."""
 
-from typing import Dict, List, Optional, Tuple
+from collections import deque
+from typing import Dict, Optional, Tuple, Union
 
 from zinkwell.bluetooth.base import BluetoothTransport
 
@@ -13,7 +14,7 @@ class MockTransport(BluetoothTransport):
 
     Example:
         mock = MockTransport(responses={
-            b"\\x43\\x0f...": b"response_bytes...",
+            COMMAND_GET_STATUS: b"response_bytes...",
         })
         printer = CanonIvy2Printer("AA:BB:CC:DD:EE:FF", transport=mock)
         printer.connect()
@@ -22,18 +23,42 @@ class MockTransport(BluetoothTransport):
         assert len(mock.sent_commands) == 1
     """
 
-    def __init__(self, responses: Optional[Dict[bytes, bytes]] = None):
+    def __init__(
+        self,
+        responses: Optional[Dict[object, bytes]] = None,
+        record_commands: bool = True,
+    ):
         """Initialize mock transport.
 
         Args:
-            responses: Mapping of command prefixes to response bytes.
-                       When send() is called, looks up response by first 8 bytes.
+            responses: Mapping of command keys to response bytes. Keys
+                may be 8-byte command prefixes, or int command ids
+                matched against bytes 5-6 of each frame (the command
+                field in both supported protocols). Int keys make the
+                per-send lookup two byte indexes instead of a bytes
+                allocation and hash.
+            record_commands: If False, sent data is counted but not
+                stored - for long mock-driven runs that would otherwise
+                retain every frame.
         """
         self.responses = responses or {}
-        self.sent_commands: List[bytes] = []
+        # Split by key type once so send() does a single dict probe
+        self._by_prefix: Dict[bytes, bytes] = {}
+        self._by_command: Dict[int, bytes] = {}
+        for key, response in self.responses.items():
+            if isinstance(key, int):
+                self._by_command[key] = response
+            else:
+                self._by_prefix[bytes(key)] = response
+        self.record_commands = record_commands
+        # Append-only and read by index/length, so a deque fits
+        self.sent_commands: deque = deque()
+        self._send_count = 0
         self._connected = False
         self._blocking = True
-        self._pending_response: Optional[bytes] = None
+        # FIFO of queued responses, so pipelined commands each get
+        # their reply in order
+        self._pending: deque = deque()
         self._address: Optional[str] = None
         self._port: Optional[int] = None
 
@@ -49,26 +74,56 @@ class MockTransport(BluetoothTransport):
         self._address = None
         self._port = None
 
-    def send(self, data: bytes) -> int:
-        """Record sent data and queue response.
+    # Protocol command frames are fixed-size for both devices
+    FRAME_SIZE = 34
 
-        Looks up response by command prefix (first 8 bytes).
-        """
-        self.sent_commands.append(data)
+    def send(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """Record sent data and queue responses.
 
-        # Look up response by command prefix
-        cmd_prefix = data[:8] if len(data) >= 8 else data
-        self._pending_response = self.responses.get(cmd_prefix)
+        Accepts any bytes-like object, matching the real transports,
+        which receive memoryview chunks during image transfer. Looks up
+        responses by int command id (bytes 5-6), falling back to the
+        8-byte prefix for bytes-keyed response dicts. Writes that carry
+        several coalesced or pipelined command frames queue one
+        response per recognized frame, in order.
+        """
+        self._send_count += 1
+        if self.record_commands:
+            # Freeze mutable inputs so a recorded frame can't change
+            # under a later assertion
+            self.sent_commands.append(data if isinstance(data, bytes) else bytes(data))
+
+        if len(data) % self.FRAME_SIZE == 0:
+            frames = [
+                data[i:i + self.FRAME_SIZE]
+                for i in range(0, len(data), self.FRAME_SIZE)
+            ]
+        else:
+            frames = [data]
+
+        for frame in frames:
+            response = None
+            if self._by_command and len(frame) >= 7:
+                response = self._by_command.get((frame[5] << 8) | frame[6])
+            if response is None and self._by_prefix and len(frame) >= 8:
+                response = self._by_prefix.get(bytes(frame[:8]))
+            if response is not None:
+                self._pending.append(response)
 
         return len(data)
 
     def recv(self, size: int) -> bytes:
-        """Return queued response."""
-        if not self._blocking and self._pending_response is None:
-            raise BlockingIOError("No data available")
-
-        response = self._pending_response or b""
-        self._pending_response = None
+        """Return the next queued response."""
+        if not self._pending:
+            if not self._blocking:
+                raise BlockingIOError("No data available")
+            return b""
+
+        response = self._pending.popleft()
+        # Readers pass buffer sizes well above the 34-byte frame, so
+        # the already-immutable response can be handed back uncopied
+        if size >= len(response):
+            return response
         return response[:size]
 
     def set_blocking(self, blocking: bool) -> None:
@@ -85,7 +140,13 @@ class MockTransport(BluetoothTransport):
             raise OSError("Not connected")
         return (self._address or "AA:BB:CC:DD:EE:FF", self._port or 1)
 
+    @property
+    def sent_commands_count(self) -> int:
+        """Number of sends, tracked even when recording is off."""
+        return self._send_count
+
     def clear(self) -> None:
         """Clear recorded commands and pending responses."""
         self.sent_commands.clear()
-        self._pending_response = None
+        self._send_count = 0
+        self._pending.clear()
@@ -4,6 +4,7 @@ These tests focus on behavior we can verify without actual Bluetooth hardware.
 Connected-state behavior is tested in integration tests.
 """
 
+import errno
 import socket
 from unittest.mock import MagicMock, patch
 
@@ -26,61 +27,75 @@ class TestNativeTransportDisconnectedState:
         transport = NativeTransport()
         transport.disconnect()  # Should not raise
 
-    def test_send_when_not_connected_raises(self):
-        """Send when not connected should raise ConnectionError."""
+    @pytest.mark.parametrize("op,args", [
+        ("send", (b"data",)),
+        ("recv", (1024,)),
+        ("get_peer_name", ()),
+    ])
+    def test_operation_when_not_connected_raises(self, op, args):
+        """Any I/O operation when not connected should raise ConnectionError."""
         transport = NativeTransport()
         with pytest.raises(ConnectionError, match="Not connected"):
-            transport.send(b"data")
+            getattr(transport, op)(*args)
 
-    def test_recv_when_not_connected_raises(self):
-        """Recv when not connected should raise ConnectionError."""
-        transport = NativeTransport()
-        with pytest.raises(ConnectionError, match="Not connected"):
-            transport.recv(1024)
 
-    def test_get_peer_name_when_not_connected_raises(self):
-        """get_peer_name when not connected should raise ConnectionError."""
-        transport = NativeTransport()
-        with pytest.raises(ConnectionError, match="Not connected"):
-            transport.get_peer_name()
+@pytest.fixture
+def mock_socket(monkeypatch):
+    """A mocked socket instance wired into socket.socket.
+
+    Also fills in the Bluetooth address-family constants so the tests
+    run on platforms whose Python lacks socket.AF_BLUETOOTH. One
+    fixture replaces the per-test @patch decorators and MagicMock
+    wiring each connection test repeated.
+    """
+    monkeypatch.setattr(socket, "AF_BLUETOOTH", 31, raising=False)
+    monkeypatch.setattr(socket, "BTPROTO_RFCOMM", 3, raising=False)
+
+    sock = MagicMock()
+    sock.connect_ex.return_value = 0
+    monkeypatch.setattr(socket, "socket", MagicMock(return_value=sock))
+    return sock
 
 
 class TestNativeTransportConnection:
     """Tests for connection behavior."""
 
-    @patch("socket.socket")
-    def test_connection_failure_raises_connection_error(self, mock_socket_class):
+    def test_connection_failure_raises_connection_error(self, mock_socket):
         """Connection failure should raise ConnectionError with details."""
-        mock_socket = MagicMock()
-        mock_socket.connect.side_effect = OSError("Connection refused")
-        mock_socket_class.return_value = mock_socket
+        mock_socket.connect_ex.return_value = errno.ECONNREFUSED
 
         transport = NativeTransport()
 
         with pytest.raises(ConnectionError, match="Failed to connect"):
             transport.connect("AA:BB:CC:DD:EE:FF", 1)
 
-    @patch("socket.socket")
-    def test_uses_bluetooth_rfcomm_socket(self, mock_socket_class):
-        """Connect should use Bluetooth RFCOMM socket type."""
-        mock_socket = MagicMock()
-        mock_socket_class.return_value = mock_socket
+    @patch("zinkwell.bluetooth.native.select.select")
+    def test_connection_timeout_raises_connection_error(self, mock_select, mock_socket):
+        """Unanswered connect should fail within the timeout bound."""
+        mock_socket.connect_ex.return_value = errno.EINPROGRESS
+        mock_select.return_value = ([], [], [])  # Never becomes writable
 
+        transport = NativeTransport()
+
+        with pytest.raises(ConnectionError, match="Failed to connect"):
+            transport.connect("AA:BB:CC:DD:EE:FF", 1, connect_timeout=0.1)
+
+        mock_select.assert_called_once()
+        assert mock_select.call_args[0][3] == 0.1
+
+    def test_uses_bluetooth_rfcomm_socket(self, mock_socket):
+        """Connect should use Bluetooth RFCOMM socket type."""
         transport = NativeTransport()
         transport.connect("AA:BB:CC:DD:EE:FF", 1)
 
-        mock_socket_class.assert_called_once_with(
+        socket.socket.assert_called_once_with(
             socket.AF_BLUETOOTH,
             socket.SOCK_STREAM,
             socket.BTPROTO_RFCOMM,
         )
 
-    @patch("socket.socket")
-    def test_disconnect_closes_socket(self, mock_socket_class):
+    def test_disconnect_closes_socket(self, mock_socket):
         """Disconnect should close the socket."""
-        mock_socket = MagicMock()
-        mock_socket_class.return_value = mock_socket
-
         transport = NativeTransport()
         transport.connect("AA:BB:CC:DD:EE:FF", 1)
         transport.disconnect()
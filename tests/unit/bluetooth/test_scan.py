@@ -0,0 +1,228 @@
+"""Unit tests for RFCOMM port scanning.
+
+These tests use fake sockets and a fake selector - no Bluetooth hardware
+(or even Bluetooth socket support) is needed.
+"""
+
+import errno
+import socket
+import sys
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from zinkwell.bluetooth import scan
+from zinkwell.bluetooth.scan import (
+    check_port,
+    discover_rfcomm_channels,
+    find_printer_port,
+    scan_ports,
+)
+
+
+class FakeSocket:
+    """Non-blocking socket stand-in with a scripted connect result."""
+
+    def __init__(self, connect_result, so_error=0):
+        self.connect_result = connect_result
+        self.so_error = so_error
+        self.closed = False
+
+    def setblocking(self, flag):
+        self.blocking = flag
+
+    def connect_ex(self, address):
+        return self.connect_result
+
+    def getsockopt(self, level, option):
+        return self.so_error
+
+    def close(self):
+        self.closed = True
+
+
+class FakeSelector:
+    """Selector stand-in that reports every registered socket as ready."""
+
+    def __init__(self):
+        self.registered = {}
+
+    def register(self, sock, events, data=None):
+        self.registered[sock] = SimpleNamespace(fileobj=sock, data=data)
+
+    def unregister(self, sock):
+        del self.registered[sock]
+
+    def select(self, timeout=None):
+        return [(key, 0) for key in list(self.registered.values())]
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_bluetooth(monkeypatch):
+    """Patch socket/selector so scan_ports runs against scripted sockets.
+
+    Returns a function that installs a list of FakeSockets, handed out
+    one per probed port.
+    """
+    monkeypatch.setattr(socket, "AF_BLUETOOTH", 31, raising=False)
+    monkeypatch.setattr(socket, "BTPROTO_RFCOMM", 3, raising=False)
+    monkeypatch.setattr(scan.selectors, "DefaultSelector", FakeSelector)
+
+    def install(sockets):
+        remaining = list(sockets)
+        monkeypatch.setattr(
+            socket, "socket", lambda *args, **kwargs: remaining.pop(0)
+        )
+        return sockets
+
+    return install
+
+
+class TestScanPorts:
+    """Tests for scan_ports."""
+
+    def test_open_ports_detected(self, fake_bluetooth):
+        """Ports whose connect resolves without error are reported open."""
+        sockets = fake_bluetooth([
+            FakeSocket(errno.EINPROGRESS, so_error=0),
+            FakeSocket(errno.EINPROGRESS, so_error=errno.ECONNREFUSED),
+            FakeSocket(errno.EINPROGRESS, so_error=0),
+        ])
+
+        result = scan_ports("AA:BB:CC:DD:EE:FF", max_port=3, port_timeout=0.1)
+
+        assert result == [1, 3]
+        assert all(sock.closed for sock in sockets)
+
+    def test_immediate_results(self, fake_bluetooth):
+        """Immediate connect success/refusal is classified without waiting."""
+        sockets = fake_bluetooth([
+            FakeSocket(0),                     # Connected immediately
+            FakeSocket(errno.ECONNREFUSED),    # Refused outright
+        ])
+
+        result = scan_ports("AA:BB:CC:DD:EE:FF", max_port=2, port_timeout=0.1)
+
+        assert result == [1]
+        assert all(sock.closed for sock in sockets)
+
+    def test_all_closed_returns_empty(self, fake_bluetooth):
+        """A device with no open ports yields an empty list."""
+        fake_bluetooth([
+            FakeSocket(errno.ECONNREFUSED),
+            FakeSocket(errno.EINPROGRESS, so_error=errno.ETIMEDOUT),
+        ])
+
+        result = scan_ports("AA:BB:CC:DD:EE:FF", max_port=2, port_timeout=0.1)
+
+        assert result == []
+
+    def test_total_timeout_caps_scan(self, fake_bluetooth, monkeypatch):
+        """Unresolved probes are abandoned once total_timeout elapses."""
+
+        class NeverReadySelector(FakeSelector):
+            def select(self, timeout=None):
+                return []
+
+        monkeypatch.setattr(scan.selectors, "DefaultSelector", NeverReadySelector)
+        sockets = fake_bluetooth([FakeSocket(errno.EINPROGRESS)])
+
+        result = scan_ports(
+            "AA:BB:CC:DD:EE:FF", max_port=1, port_timeout=5.0, total_timeout=0.05
+        )
+
+        assert result == []
+        assert all(sock.closed for sock in sockets)
+
+
+class TestFindPrinterPort:
+    """Tests for find_printer_port."""
+
+    def test_returns_open_port(self, monkeypatch):
+        """The first responding candidate port is returned."""
+        monkeypatch.setattr(
+            scan, "_probe_port", lambda address, port, timeout: port == 3
+        )
+
+        assert find_printer_port("AA:BB:CC:DD:EE:FF", ports=[1, 2, 3]) == 3
+
+    def test_returns_none_when_nothing_responds(self, monkeypatch):
+        """No responding port yields None."""
+        monkeypatch.setattr(
+            scan, "_probe_port", lambda address, port, timeout: False
+        )
+
+        assert find_printer_port("AA:BB:CC:DD:EE:FF", ports=[1, 2, 3]) is None
+
+    def test_candidates_narrowed_to_advertised_channels(self, monkeypatch):
+        """Only SDP-advertised candidates are probed when SDP answers."""
+        probed = []
+
+        def probe(address, port, timeout):
+            probed.append(port)
+            return True
+
+        monkeypatch.setattr(scan, "_probe_port", probe)
+        monkeypatch.setattr(scan, "_advertised_channels", lambda address: {2})
+
+        assert find_printer_port("AA:BB:CC:DD:EE:FF", ports=[1, 2, 3]) == 2
+        assert probed == [2]
+
+    def test_invalid_candidates_dropped(self, monkeypatch):
+        """Duplicate and out-of-range candidate ports are not probed."""
+        probed = []
+
+        def probe(address, port, timeout):
+            probed.append(port)
+            return False
+
+        monkeypatch.setattr(scan, "_probe_port", probe)
+        monkeypatch.setattr(scan, "_advertised_channels", lambda address: None)
+
+        assert find_printer_port("AA:BB:CC:DD:EE:FF", ports=[0, 2, 2, 99]) is None
+        assert probed == [2]
+
+
+class TestCheckPort:
+    """Tests for check_port."""
+
+    @pytest.mark.parametrize("so_error,expected", [
+        (0, True),
+        (errno.ECONNREFUSED, False),
+    ])
+    def test_classifies_connect_result(self, fake_bluetooth, so_error, expected):
+        """SO_ERROR after the connect resolves decides the result."""
+        sockets = fake_bluetooth([
+            FakeSocket(errno.EINPROGRESS, so_error=so_error),
+        ])
+
+        result = check_port("AA:BB:CC:DD:EE:FF", 1, timeout=0.1)
+
+        assert result is expected
+        assert sockets[0].closed
+
+
+class TestDiscoverRfcommChannels:
+    """Tests for discover_rfcomm_channels."""
+
+    def test_returns_advertised_channels(self, monkeypatch):
+        """Channels from the SDP service records are returned sorted."""
+        fake_bluetooth = ModuleType("bluetooth")
+        fake_bluetooth.find_service = lambda address: [
+            {"protocol": "RFCOMM", "port": 5},
+            {"protocol": "RFCOMM", "port": 1},
+            {"protocol": "L2CAP", "port": 25},  # Not RFCOMM - ignored
+        ]
+        monkeypatch.setitem(sys.modules, "bluetooth", fake_bluetooth)
+
+        assert discover_rfcomm_channels("AA:BB:CC:DD:EE:FF") == [1, 5]
+
+    def test_falls_back_to_probe_scan_without_pybluez(self, monkeypatch):
+        """Without pybluez the connect probe scan is used instead."""
+        monkeypatch.setitem(sys.modules, "bluetooth", None)
+        monkeypatch.setattr(scan, "scan_ports", lambda address: [2])
+
+        assert discover_rfcomm_channels("AA:BB:CC:DD:EE:FF") == [2]
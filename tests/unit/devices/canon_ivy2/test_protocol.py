@@ -20,6 +20,11 @@ from zinkwell.devices.canon_ivy2.protocol import (
     ACK_GET_STATUS,
 )
 
+# Zeroed packet/payload templates; bytearray(ZEROS_34) copies the shared
+# constant instead of re-zeroing a fresh allocation per test
+ZEROS_34 = bytes(34)
+ZEROS_10 = bytes(10)
+
 
 class TestParseBitRange:
     """Tests for parse_bit_range function."""
@@ -42,7 +47,7 @@ class TestParseMessage:
 
     def test_parse_basic_message(self):
         # Build a 34-byte message with known values
-        data = bytearray(34)
+        data = bytearray(ZEROS_34)
         data[5] = 0x01  # ACK high byte
         data[6] = 0x01  # ACK low byte = 257
         data[7] = 0x00  # Error = 0
@@ -56,7 +61,7 @@ class TestParseMessage:
         assert result.payload == b"payload_data_here___"
 
     def test_parse_message_with_error(self):
-        data = bytearray(34)
+        data = bytearray(ZEROS_34)
         data[7] = 0x05  # Error code 5
 
         result = parse_message(bytes(data))
@@ -108,7 +113,7 @@ class TestStartSessionTask:
         task = StartSessionTask()
 
         # Build mock response with battery=50, MTU=512
-        data = bytearray(34)
+        data = bytearray(ZEROS_34)
         data[9] = 0x00
         data[10] = 50  # Battery in lower bits
         data[11] = 0x02  # MTU high byte
@@ -131,7 +136,7 @@ class TestGetStatusTask:
         task = GetStatusTask()
 
         # Build payload with no errors, 80% battery
-        payload = bytearray(10)
+        payload = bytearray(ZEROS_10)
         payload[0] = 0x00
         payload[1] = 80  # Battery encoded
         payload[2] = 0  # Error code
@@ -145,19 +150,17 @@ class TestGetStatusTask:
             error=0,
         )
 
-        error_code, battery, usb, cover_open, no_paper, wrong_sheet = task.process_response(
-            response
-        )
+        status = task.process_response(response)
 
-        assert error_code == 0
-        assert not cover_open
-        assert not no_paper
-        assert not wrong_sheet
+        assert status.error_code == 0
+        assert not status.is_cover_open
+        assert not status.is_no_paper
+        assert not status.is_wrong_smart_sheet
 
     def test_process_response_cover_open(self):
         task = GetStatusTask()
 
-        payload = bytearray(10)
+        payload = bytearray(ZEROS_10)
         payload[4] = 0x00
         payload[5] = 0x01  # Cover open flag
 
@@ -168,15 +171,15 @@ class TestGetStatusTask:
             error=0,
         )
 
-        _, _, _, cover_open, no_paper, _ = task.process_response(response)
+        status = task.process_response(response)
 
-        assert cover_open
-        assert not no_paper
+        assert status.is_cover_open
+        assert not status.is_no_paper
 
     def test_process_response_no_paper(self):
         task = GetStatusTask()
 
-        payload = bytearray(10)
+        payload = bytearray(ZEROS_10)
         payload[4] = 0x00
         payload[5] = 0x02  # No paper flag
 
@@ -187,10 +190,10 @@ class TestGetStatusTask:
             error=0,
         )
 
-        _, _, _, cover_open, no_paper, _ = task.process_response(response)
+        status = task.process_response(response)
 
-        assert not cover_open
-        assert no_paper
+        assert not status.is_cover_open
+        assert status.is_no_paper
 
 
 class TestGetSettingTask:
@@ -200,7 +203,7 @@ class TestGetSettingTask:
         task = GetSettingTask()
 
         # Build payload with settings
-        payload = bytearray(10)
+        payload = bytearray(ZEROS_10)
         payload[0] = 5  # Auto power off = 5 minutes
         payload[1] = 1  # Firmware major
         payload[2] = 2  # Firmware minor
@@ -217,13 +220,13 @@ class TestGetSettingTask:
             error=0,
         )
 
-        auto_off, firmware, tmd, photos, color = task.process_response(response)
+        settings = task.process_response(response)
 
-        assert auto_off == 5
-        assert firmware == "1.2.3"
-        assert tmd == 1
-        assert photos == 42
-        assert color == 1
+        assert settings.auto_power_off == 5
+        assert settings.firmware_version == "1.2.3"
+        assert settings.tmd_version == 1
+        assert settings.photos_printed == 42
+        assert settings.color_id == 1
 
 
 class TestSetSettingTask:
@@ -263,7 +266,7 @@ class TestGetPrintReadyTask:
         """process_response should extract error code."""
         task = GetPrintReadyTask(length=1000)
 
-        payload = bytearray(10)
+        payload = bytearray(ZEROS_10)
         payload[3] = 5  # Error code
 
         response = ParsedMessage(
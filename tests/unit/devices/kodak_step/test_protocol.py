@@ -30,6 +30,22 @@ from zinkwell.devices.kodak_step.protocol import (
     PrintReadyTask,
 )
 
+# Zeroed packet with the 4-byte header already in place; response
+# builders copy it instead of re-zeroing and re-writing the header
+_PACKET_TEMPLATE = HEADER + bytes(PACKET_SIZE - 4)
+
+
+def make_response(overrides=None):
+    """Build a response packet from the template, setting single bytes.
+
+    Args:
+        overrides: Mapping of byte offset to value.
+    """
+    data = bytearray(_PACKET_TEMPLATE)
+    for offset, value in (overrides or {}).items():
+        data[offset] = value
+    return bytes(data)
+
 
 class TestConstants:
     """Tests for protocol constants."""
@@ -74,8 +90,7 @@ class TestParseResponse:
     """Tests for parse_response function."""
 
     def test_parse_valid_response(self):
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
+        data = bytearray(_PACKET_TEMPLATE)
         data[6] = CMD_GET_ACCESSORY_INFO
         data[7] = 0x00
         data[8] = ERR_SUCCESS
@@ -90,20 +105,13 @@ class TestParseResponse:
         assert len(response.payload) == 25
 
     def test_parse_error_response(self):
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = ERR_NO_PAPER
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: ERR_NO_PAPER}))
 
         assert response.error_code == ERR_NO_PAPER
 
     def test_parse_invalid_header(self):
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = b"\x00\x00\x00\x00"
-
         with pytest.raises(ValueError, match="Invalid header"):
-            parse_response(bytes(data))
+            parse_response(bytes(PACKET_SIZE))
 
     def test_parse_short_response(self):
         data = b"\x1B\x2A\x43\x41"  # Only header, too short
@@ -116,20 +124,13 @@ class TestValidateResponse:
     """Tests for validate_response function."""
 
     def test_valid_response(self):
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = ERR_SUCCESS
-
-        is_valid, error_code = validate_response(bytes(data))
+        is_valid, error_code = validate_response(make_response({8: ERR_SUCCESS}))
 
         assert is_valid
         assert error_code == ERR_SUCCESS
 
     def test_invalid_header(self):
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = b"\x00\x00\x00\x00"
-
-        is_valid, error_code = validate_response(bytes(data))
+        is_valid, error_code = validate_response(bytes(PACKET_SIZE))
 
         assert not is_valid
 
@@ -181,13 +182,8 @@ class TestGetAccessoryInfoTask:
     def test_process_response(self):
         task = GetAccessoryInfoTask()
 
-        # Build mock response with battery=75 at byte 12
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = ERR_SUCCESS
-        data[12] = 75  # Battery level
-
-        response = parse_response(bytes(data))
+        # Mock response with battery=75 at byte 12
+        response = parse_response(make_response({8: ERR_SUCCESS, 12: 75}))
         battery, is_charging = task.process_response(response)
 
         assert battery == 75
@@ -210,11 +206,7 @@ class TestGetBatteryLevelTask:
     def test_process_response_charging(self):
         task = GetBatteryLevelTask()
 
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = 1  # Charging
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: 1}))  # Charging
         is_charging = task.process_response(response)
 
         assert is_charging is True
@@ -222,11 +214,7 @@ class TestGetBatteryLevelTask:
     def test_process_response_not_charging(self):
         task = GetBatteryLevelTask()
 
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = 0  # Not charging
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: 0}))  # Not charging
         is_charging = task.process_response(response)
 
         assert is_charging is False
@@ -249,11 +237,7 @@ class TestGetPageTypeTask:
     def test_process_response_success(self):
         task = GetPageTypeTask()
 
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = ERR_SUCCESS
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: ERR_SUCCESS}))
         error_code = task.process_response(response)
 
         assert error_code == ERR_SUCCESS
@@ -261,11 +245,7 @@ class TestGetPageTypeTask:
     def test_process_response_no_paper(self):
         task = GetPageTypeTask()
 
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = ERR_NO_PAPER
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: ERR_NO_PAPER}))
         error_code = task.process_response(response)
 
         assert error_code == ERR_NO_PAPER
@@ -290,12 +270,7 @@ class TestGetPrintCountTask:
         task = GetPrintCountTask()
 
         # Print count = 1234 = 0x04D2
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = 0x04
-        data[9] = 0xD2
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: 0x04, 9: 0xD2}))
         count = task.process_response(response)
 
         assert count == 1234
@@ -318,11 +293,7 @@ class TestGetAutoPowerOffTask:
     def test_process_response(self):
         task = GetAutoPowerOffTask()
 
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = 10  # 10 minutes
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: 10}))  # 10 minutes
         minutes = task.process_response(response)
 
         assert minutes == 10
@@ -363,11 +334,7 @@ class TestPrintReadyTask:
     def test_process_response_success(self):
         task = PrintReadyTask(image_size=1000)
 
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = ERR_SUCCESS
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: ERR_SUCCESS}))
         error_code = task.process_response(response)
 
         assert error_code == ERR_SUCCESS
@@ -375,11 +342,7 @@ class TestPrintReadyTask:
     def test_process_response_error(self):
         task = PrintReadyTask(image_size=1000)
 
-        data = bytearray(PACKET_SIZE)
-        data[0:4] = HEADER
-        data[8] = ERR_NO_PAPER
-
-        response = parse_response(bytes(data))
+        response = parse_response(make_response({8: ERR_NO_PAPER}))
         error_code = task.process_response(response)
 
         assert error_code == ERR_NO_PAPER
@@ -0,0 +1,62 @@
+"""Unit tests for AsyncClient."""
+
+import asyncio
+import socket
+
+import pytest
+
+from zinkwell.utils.aio import AsyncClient
+from zinkwell.exceptions import ConnectionError
+
+
+class TestAsyncClient:
+    """Tests for AsyncClient over a local socket pair."""
+
+    def test_send_and_recv_round_trip(self):
+        """Data sent by the client arrives at the peer and vice versa."""
+
+        async def scenario():
+            local, peer = socket.socketpair()
+            peer.setblocking(False)
+            loop = asyncio.get_running_loop()
+
+            client = AsyncClient()
+            await client.connect("AA:BB:CC:DD:EE:FF", 1, sock=local)
+
+            await client.send(b"ping")
+            assert await loop.sock_recv(peer, 4) == b"ping"
+
+            await loop.sock_sendall(peer, b"pong")
+            assert await client.recv(4) == b"pong"
+
+            await client.disconnect()
+            peer.close()
+            assert not client.is_connected
+
+        asyncio.run(scenario())
+
+    def test_send_when_not_connected_raises(self):
+        """Send before connect should raise ConnectionError."""
+
+        async def scenario():
+            client = AsyncClient()
+            with pytest.raises(ConnectionError, match="Not connected"):
+                await client.send(b"data")
+
+        asyncio.run(scenario())
+
+    def test_auto_disconnect_after_inactivity(self):
+        """The client closes itself once the inactivity timeout passes."""
+
+        async def scenario():
+            local, peer = socket.socketpair()
+
+            client = AsyncClient(auto_disconnect_timeout=0.05)
+            await client.connect("AA:BB:CC:DD:EE:FF", 1, sock=local)
+            assert client.is_connected
+
+            await asyncio.sleep(0.2)
+            assert not client.is_connected
+            peer.close()
+
+        asyncio.run(scenario())
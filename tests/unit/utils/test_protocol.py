@@ -0,0 +1,77 @@
+"""Unit tests for TaskRunner."""
+
+import queue
+import threading
+
+import pytest
+
+from zinkwell.utils.protocol import TaskRunner
+from zinkwell.exceptions import ConnectionError, TimeoutError
+
+
+class FakeClient:
+    """Minimal stand-in for ThreadedClient."""
+
+    def __init__(self, alive=True):
+        self.alive = threading.Event()
+        if alive:
+            self.alive.set()
+        self.outbound_q = queue.Queue()
+        self.inbound_q = queue.Queue()
+
+
+class EchoTask:
+    """Task whose response processing just returns the parsed data."""
+
+    def get_message(self):
+        return b"request"
+
+    def process_response(self, response):
+        return response
+
+
+class TestTaskRunner:
+    """Tests for the shared task execution loop."""
+
+    def test_perform_round_trip(self):
+        """perform sends the task message and returns the processed reply."""
+        client = FakeClient()
+        client.inbound_q.put(b"reply")
+        runner = TaskRunner(client, parse=lambda data: data.decode())
+
+        result = runner.perform(EchoTask())
+
+        assert result == "reply"
+        assert client.outbound_q.get_nowait() == b"request"
+
+    def test_send_when_not_connected_raises(self):
+        """send fails fast when the client thread is not running."""
+        runner = TaskRunner(FakeClient(alive=False), parse=bytes)
+
+        with pytest.raises(ConnectionError, match="Not connected"):
+            runner.send(b"request")
+
+    def test_receive_when_connection_lost_raises(self):
+        """receive reports a dropped connection instead of waiting."""
+        runner = TaskRunner(FakeClient(alive=False), parse=bytes)
+
+        with pytest.raises(ConnectionError, match="Connection lost"):
+            runner.receive()
+
+    def test_receive_drops_unmatched_frames(self):
+        """A stale frame failing the match predicate is skipped."""
+        client = FakeClient()
+        client.inbound_q.put(b"stale")
+        client.inbound_q.put(b"fresh")
+        runner = TaskRunner(client, parse=lambda data: data.decode())
+
+        result = runner.receive(match=lambda response: response == "fresh")
+
+        assert result == "fresh"
+
+    def test_receive_timeout_raises(self):
+        """receive raises TimeoutError once the deadline passes."""
+        runner = TaskRunner(FakeClient(), parse=bytes)
+
+        with pytest.raises(TimeoutError, match="No response within"):
+            runner.receive(timeout=0.1)
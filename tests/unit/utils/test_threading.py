@@ -1,7 +1,7 @@
 """Unit tests for ThreadedClient."""
 
 import time
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
@@ -49,6 +49,29 @@ class TestThreadedClientTransportErrors:
 
         assert not client.alive.is_set()
 
+    def test_batch_item_sends_each_part(self):
+        """A tuple enqueued as one item is written part by part, in order."""
+        mock_transport = MagicMock()
+        mock_transport.is_connected.return_value = True
+        mock_transport.recv_into.side_effect = OSError("No data")
+
+        client = ThreadedClient(mock_transport)
+        client.alive.set()
+        client.start()
+
+        client.outbound_q.put((b"one", b"two", b"three"))
+
+        # Give the thread a moment to drain the batch
+        time.sleep(0.3)
+        client.alive.clear()
+        client.join(timeout=1)
+
+        assert mock_transport.send.call_args_list == [
+            call(b"one"),
+            call(b"two"),
+            call(b"three"),
+        ]
+
     def test_normal_disconnect_clears_alive_flag(self):
         """Normal disconnect should clear alive flag."""
         mock_transport = MagicMock()
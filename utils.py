@@ -1,20 +1,17 @@
-def parse_bit_range(input, size):
-    str = ""
+import struct
+
+# ack (bytes 5-6, big-endian) and error (byte 7); compiled once
+_ACK_ERROR_STRUCT = struct.Struct(">5xHB")
 
-    for i in range(size):
-        str += "1" if ((input >> i) & 1) == 1 else "0"
 
-    try:
-        return int(str[::-1], 2)
-    except:
-        return 0
+def parse_bit_range(input, size):
+    # Mask off the low `size` bits
+    return input & ((1 << size) - 1)
 
 
 def parse_incoming_message(data):
     """General parser for all messages coming from the printer."""
 
-    payload = data[8:len(data)]
-    ack = (data[6] & 255) | ((data[5] & 255) << 8)
-    error = data[7] & 255
+    ack, error = _ACK_ERROR_STRUCT.unpack_from(data)
 
-    return data, payload, ack, error
+    return data, data[8:], ack, error
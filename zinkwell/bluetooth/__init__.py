@@ -2,11 +2,16 @@
 
 from .base import BluetoothTransport
 from .native import NativeTransport
+from .scan import check_port, discover_rfcomm_channels, find_printer_port, scan_ports
 
 __all__ = [
     "BluetoothTransport",
     "NativeTransport",
+    "check_port",
+    "discover_rfcomm_channels",
+    "find_printer_port",
     "get_transport",
+    "scan_ports",
 ]
 
 
@@ -68,6 +68,30 @@ class BluetoothTransport(ABC):
         """
         pass
 
+    def recv_into(self, buffer: bytearray) -> int:
+        """Receive data into a preallocated buffer.
+
+        The default implementation falls back to recv() and copies.
+        Transports should override this when the backend supports
+        receiving directly into a buffer.
+
+        Args:
+            buffer: Writable buffer to fill; at most len(buffer) bytes
+                are received.
+
+        Returns:
+            Number of bytes received.
+
+        Raises:
+            ConnectionError: If not connected.
+            TransportError: If receive fails.
+            BlockingIOError: If non-blocking and no data available.
+        """
+        data = self.recv(len(buffer))
+        received = len(data)
+        buffer[:received] = data
+        return received
+
     @abstractmethod
     def set_blocking(self, blocking: bool) -> None:
         """Set socket blocking mode.
@@ -4,12 +4,21 @@ Uses Python's built-in socket module with AF_BLUETOOTH for RFCOMM
 communication. Works on Windows and Linux without external dependencies.
 """
 
+import errno
+import os
+import select
 import socket
 from typing import Tuple, Optional
 
 from .base import BluetoothTransport
 from ..exceptions import ConnectionError, TransportError
 
+# Default bound on how long connect() may block
+DEFAULT_CONNECT_TIMEOUT = 2.0
+
+# connect_ex results that mean "connect still in progress"
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+
 
 class NativeTransport(BluetoothTransport):
     """Bluetooth transport using Python's native socket module.
@@ -26,24 +35,53 @@ class NativeTransport(BluetoothTransport):
     def __init__(self):
         self._socket: Optional[socket.socket] = None
 
-    def connect(self, address: str, port: int) -> None:
+    def connect(
+        self,
+        address: str,
+        port: int,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    ) -> None:
         """Connect to a Bluetooth device.
 
+        Uses a non-blocking connect bounded by connect_timeout, so a
+        powered-off or out-of-range device fails fast instead of
+        blocking for the OS default (often several seconds).
+
         Args:
             address: Bluetooth MAC address (e.g., "AA:BB:CC:DD:EE:FF")
             port: RFCOMM channel (typically 1)
+            connect_timeout: Maximum seconds to wait for the connection.
 
         Raises:
-            ConnectionError: If connection fails.
+            ConnectionError: If connection fails or times out.
         """
+        sock = None
         try:
-            self._socket = socket.socket(
+            sock = socket.socket(
                 socket.AF_BLUETOOTH,
                 socket.SOCK_STREAM,
                 socket.BTPROTO_RFCOMM,
             )
-            self._socket.connect((address, port))
+            sock.setblocking(False)
+
+            result = sock.connect_ex((address, port))
+            if result != 0:
+                if result not in _IN_PROGRESS:
+                    raise OSError(result, os.strerror(result))
+
+                _, writable, _ = select.select([], [sock], [], connect_timeout)
+                if not writable:
+                    raise OSError(errno.ETIMEDOUT, "Connect timed out")
+
+                error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if error != 0:
+                    raise OSError(error, os.strerror(error))
+
+            sock.setblocking(True)
+            self._socket = sock
         except OSError as e:
+            if sock is not None:
+                sock.close()
             self._socket = None
             raise ConnectionError(f"Failed to connect to {address}:{port}: {e}") from e
 
@@ -103,6 +141,30 @@ class NativeTransport(BluetoothTransport):
         except OSError as e:
             raise TransportError(f"Receive failed: {e}") from e
 
+    def recv_into(self, buffer: bytearray) -> int:
+        """Receive data directly into a preallocated buffer.
+
+        Args:
+            buffer: Writable buffer to fill.
+
+        Returns:
+            Number of bytes received.
+
+        Raises:
+            ConnectionError: If not connected.
+            TransportError: If receive fails.
+            BlockingIOError: If non-blocking and no data available.
+        """
+        if self._socket is None:
+            raise ConnectionError("Not connected")
+
+        try:
+            return self._socket.recv_into(buffer)
+        except BlockingIOError:
+            raise  # Let caller handle non-blocking case
+        except OSError as e:
+            raise TransportError(f"Receive failed: {e}") from e
+
     def set_blocking(self, blocking: bool) -> None:
         """Set socket blocking mode.
 
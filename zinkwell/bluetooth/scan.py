@@ -0,0 +1,258 @@
+"""RFCOMM port scanning utilities.
+
+Probes a device's RFCOMM channels to find open ports. All probes run
+concurrently using non-blocking connects and a selector, so a full scan
+completes in roughly one timeout window instead of one timeout per port.
+"""
+
+import errno
+import selectors
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional
+
+from loguru import logger
+
+# Per-probe connect timeout in seconds
+DEFAULT_PORT_TIMEOUT = 2.0
+
+# Hard wall-clock cap on a whole scan, regardless of other settings
+DEFAULT_TOTAL_TIMEOUT = 10.0
+
+# connect_ex results that mean "connect still in progress"
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+
+
+def scan_ports(
+    address: str,
+    max_port: int = 30,
+    port_timeout: float = DEFAULT_PORT_TIMEOUT,
+    total_timeout: float = DEFAULT_TOTAL_TIMEOUT,
+) -> List[int]:
+    """Find open RFCOMM channels on a device.
+
+    Probes channels 1..max_port in parallel: each socket starts a
+    non-blocking connect, then a single selector waits for all of them
+    to resolve within one timeout window. The whole scan is hard-capped
+    at total_timeout so it never runs unbounded against an unresponsive
+    device.
+
+    Args:
+        address: Bluetooth MAC address (e.g., "AA:BB:CC:DD:EE:FF")
+        max_port: Highest RFCOMM channel to probe.
+        port_timeout: Seconds to wait for the connect attempts.
+        total_timeout: Wall-clock cap for the whole scan.
+
+    Returns:
+        Sorted list of open RFCOMM channels.
+    """
+    selector = selectors.DefaultSelector()
+    pending = {}  # socket -> port
+    open_ports = []
+
+    try:
+        for port in range(1, max_port + 1):
+            sock = socket.socket(
+                socket.AF_BLUETOOTH,
+                socket.SOCK_STREAM,
+                socket.BTPROTO_RFCOMM,
+            )
+            sock.setblocking(False)
+
+            result = sock.connect_ex((address, port))
+            if result == 0:
+                # Connected immediately
+                open_ports.append(port)
+                sock.close()
+            elif result in _IN_PROGRESS:
+                selector.register(sock, selectors.EVENT_WRITE, port)
+                pending[sock] = port
+            else:
+                # Refused outright - port closed
+                sock.close()
+
+        deadline = time.monotonic() + min(port_timeout, total_timeout)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Unresolved probes count as timed out
+                logger.warning(
+                    f"Aborting RFCOMM scan of {address} with "
+                    f"{len(pending)} probes unresolved"
+                )
+                break
+
+            for key, _ in selector.select(timeout=remaining):
+                sock = key.fileobj
+                port = key.data
+                error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if error == 0:
+                    logger.debug(f"RFCOMM port {port} open on {address}")
+                    open_ports.append(port)
+
+                selector.unregister(sock)
+                sock.close()
+                del pending[sock]
+    finally:
+        for sock in pending:
+            sock.close()
+        selector.close()
+
+    return sorted(open_ports)
+
+
+def discover_rfcomm_channels(address: str) -> List[int]:
+    """Discover advertised RFCOMM channels via an SDP service search.
+
+    A single SDP query returns every channel the device advertises,
+    avoiding one RFCOMM handshake per probed port and leaving the
+    device undisturbed. Requires pybluez; falls back to the connect
+    probe scan when it is not installed.
+
+    Args:
+        address: Bluetooth MAC address (e.g., "AA:BB:CC:DD:EE:FF")
+
+    Returns:
+        Sorted list of advertised RFCOMM channels.
+    """
+    try:
+        import bluetooth
+    except ImportError:
+        logger.debug("pybluez not installed; falling back to port probe scan")
+        return scan_ports(address)
+
+    channels = set()
+    for service in bluetooth.find_service(address=address):
+        if service.get("protocol") == "RFCOMM" and service.get("port"):
+            channels.add(service["port"])
+
+    return sorted(channels)
+
+
+def find_printer_port(
+    address: str,
+    ports: Optional[List[int]] = None,
+    port_timeout: float = DEFAULT_PORT_TIMEOUT,
+) -> Optional[int]:
+    """Find an RFCOMM channel on a device that accepts connections.
+
+    Probes all candidate channels concurrently and returns as soon as
+    one responds, so the search costs roughly one connect timeout
+    instead of one per candidate.
+
+    When the device advertises its services over SDP (pybluez
+    installed), the candidate list is narrowed to the advertised
+    channels first - each skipped candidate saves a full connect
+    timeout against a port that cannot answer.
+
+    Args:
+        address: Bluetooth MAC address (e.g., "AA:BB:CC:DD:EE:FF")
+        ports: Candidate channels to probe. Defaults to 1..30.
+        port_timeout: Seconds to wait for each connect attempt.
+
+    Returns:
+        An open RFCOMM channel, or None if none responded.
+    """
+    if ports is None:
+        ports = list(range(1, 31))
+    else:
+        # Drop duplicates and invalid channel numbers, keeping order
+        ports = list(dict.fromkeys(p for p in ports if 1 <= p <= 30))
+
+    advertised = _advertised_channels(address)
+    if advertised is not None:
+        narrowed = [port for port in ports if port in advertised]
+        if narrowed:
+            logger.debug(
+                f"Narrowed candidate ports to advertised channels: {narrowed}"
+            )
+            ports = narrowed
+
+    if not ports:
+        return None
+
+    found = None
+    with ThreadPoolExecutor(max_workers=len(ports)) as executor:
+        futures = {
+            executor.submit(_probe_port, address, port, port_timeout): port
+            for port in ports
+        }
+        for future in as_completed(futures):
+            if found is None and future.result():
+                found = futures[future]
+                logger.debug(f"Found open RFCOMM port {found} on {address}")
+                # Best effort - probes already running finish on their own
+                for pending in futures:
+                    pending.cancel()
+
+    return found
+
+
+def check_port(
+    address: str,
+    port: int,
+    timeout: float = DEFAULT_PORT_TIMEOUT,
+) -> bool:
+    """Check whether a single RFCOMM channel accepts a connection.
+
+    Uses a non-blocking connect bounded by the given timeout, so a
+    stalled Bluetooth stack cannot wedge the calling thread the way a
+    plain blocking connect can.
+
+    Args:
+        address: Bluetooth MAC address (e.g., "AA:BB:CC:DD:EE:FF")
+        port: RFCOMM channel to probe.
+        timeout: Seconds to wait for the connect attempt.
+
+    Returns:
+        True if the channel accepted the connection.
+    """
+    return _probe_port(address, port, timeout)
+
+
+def _advertised_channels(address: str) -> Optional[set]:
+    """SDP-advertised RFCOMM channels, or None when SDP is unavailable."""
+    try:
+        import bluetooth
+    except ImportError:
+        return None
+
+    try:
+        return {
+            service["port"]
+            for service in bluetooth.find_service(address=address)
+            if service.get("protocol") == "RFCOMM" and service.get("port")
+        }
+    except OSError:
+        # SDP query failed (device away, stack busy) - probe everything
+        return None
+
+
+def _probe_port(address: str, port: int, timeout: float) -> bool:
+    """Non-blocking bounded connect probe of a single RFCOMM channel."""
+    sock = socket.socket(
+        socket.AF_BLUETOOTH,
+        socket.SOCK_STREAM,
+        socket.BTPROTO_RFCOMM,
+    )
+    try:
+        sock.setblocking(False)
+
+        result = sock.connect_ex((address, port))
+        if result == 0:
+            return True
+        if result not in _IN_PROGRESS:
+            return False
+
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(sock, selectors.EVENT_WRITE)
+            if not selector.select(timeout=timeout):
+                return False  # Timed out
+        finally:
+            selector.close()
+
+        return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+    finally:
+        sock.close()
@@ -1,7 +1,5 @@
 """Canon Ivy 2 printer implementation."""
 
-import queue
-import time
 from typing import Any, Dict, Optional, Union
 
 from loguru import logger
@@ -9,7 +7,7 @@ from loguru import logger
 from ..base import Printer
 from ...models import PrinterStatus, PrinterInfo, PrinterCapabilities
 from ...bluetooth import get_transport, BluetoothTransport
-from ...utils import ThreadedClient
+from ...utils import TaskRunner, ThreadedClient
 from ...exceptions import (
     ConnectionError,
     PrintError,
@@ -17,7 +15,6 @@ from ...exceptions import (
     LowBatteryError,
     CoverOpenError,
     NoPaperError,
-    TimeoutError,
 )
 
 from .protocol import (
@@ -77,6 +74,7 @@ class CanonIvy2Printer(Printer):
         address: str,
         port: int = 1,
         transport: Optional[Union[str, BluetoothTransport]] = None,
+        chunk_size: Optional[int] = None,
     ):
         """Initialize Canon Ivy 2 printer.
 
@@ -85,9 +83,15 @@ class CanonIvy2Printer(Printer):
             port: RFCOMM channel (default 1).
             transport: Transport type ("native", "pybluez"), transport instance,
                 or None for auto-detection.
+            chunk_size: Fixed transfer chunk size in bytes. By default the
+                chunk size is derived from the MTU the printer reports at
+                session start (capped at PRINT_DATA_CHUNK).
         """
         self._address = address
         self._port = port
+        self._chunk_size_override = chunk_size
+        self._print_chunk_size = chunk_size or PRINT_DATA_CHUNK
+        self._mtu: Optional[int] = None
         # Store transport instance or type string
         if isinstance(transport, BluetoothTransport):
             self._transport_instance = transport
@@ -96,6 +100,7 @@ class CanonIvy2Printer(Printer):
             self._transport_instance = None
             self._transport_type = transport
         self._client: Optional[ThreadedClient] = None
+        self._runner: Optional[TaskRunner] = None
         self._firmware_version: Optional[str] = None
 
     @property
@@ -123,11 +128,11 @@ class CanonIvy2Printer(Printer):
         if self.is_connected:
             return
 
-        # Use provided transport instance or create one
-        if self._transport_instance is not None:
-            transport = self._transport_instance
-        else:
-            transport = get_transport(self._transport_type)
+        # Use provided transport instance, or create one on first use and
+        # keep it so reconnects reuse the same transport
+        if self._transport_instance is None:
+            self._transport_instance = get_transport(self._transport_type)
+        transport = self._transport_instance
 
         self._client = ThreadedClient(
             transport,
@@ -135,16 +140,25 @@ class CanonIvy2Printer(Printer):
             auto_disconnect_timeout=30,
         )
         self._client.connect(self._address, self._port)
+        self._runner = TaskRunner(self._client, parse_message)
 
         # Initialize session
         battery_level, mtu = self._perform_task(StartSessionTask())
-        logger.debug(f"Connected to Canon Ivy 2; Battery: {battery_level}%; MTU: {mtu}")
+        logger.debug("Connected to Canon Ivy 2; Battery: {}%; MTU: {}", battery_level, mtu)
+
+        # Match the transfer chunk size to the negotiated MTU unless the
+        # caller pinned one explicitly
+        self._mtu = mtu
+        if self._chunk_size_override is None and mtu:
+            self._print_chunk_size = min(mtu, PRINT_DATA_CHUNK)
+        logger.info("Using print chunk size {} bytes (MTU {})", self._print_chunk_size, mtu)
 
     def disconnect(self) -> None:
         """Disconnect from the printer."""
         if self._client is not None:
             self._client.disconnect()
             self._client = None
+            self._runner = None
 
     def print(
         self,
@@ -157,7 +171,8 @@ class CanonIvy2Printer(Printer):
         """Print an image.
 
         Args:
-            image_path: Path to image file.
+            image_path: Path to image file, or already-prepared image
+                data as a bytes-like object (sent as-is).
             auto_crop: If True, crop to fill. If False, fit with letterboxing.
             quality: JPEG quality (1-100).
             transfer_timeout: Seconds to wait for transfer completion.
@@ -169,28 +184,36 @@ class CanonIvy2Printer(Printer):
             CoverOpenError: If cover is open.
             NoPaperError: If no paper.
         """
-        # Prepare image data
-        image_data = prepare_image(image_path, auto_crop=auto_crop, quality=quality)
+        # Prepare image data; bytes-like input skips re-preparation
+        if isinstance(image_path, (bytes, bytearray, memoryview)):
+            image_data = image_path
+        else:
+            image_data = prepare_image(image_path, auto_crop=auto_crop, quality=quality)
         image_length = len(image_data)
 
         # Check printer is ready
         self._check_print_worthiness()
 
-        # Get settings (required by protocol)
-        self.get_settings()
-
-        # Prepare printer for image transfer
-        self._perform_task(GetPrintReadyTask(image_length))
+        # The protocol-required settings query and PRINT_READY are
+        # pipelined: both requests go out back-to-back and their ACKs
+        # are consumed in order, hiding one link round trip
+        settings, _ = self._perform_tasks(
+            [GetSettingTask(), GetPrintReadyTask(image_length)]
+        )
+        self._firmware_version = settings.firmware_version
 
-        # Send image data in chunks
-        start_index = 0
-        while start_index < image_length:
-            end_index = min(start_index + PRINT_DATA_CHUNK, image_length)
-            chunk = image_data[start_index:end_index]
-            self._client.outbound_q.put(chunk)
-            start_index = end_index
+        # Send image data as one batch of zero-copy views into the
+        # image buffer - a single enqueue wakes the client thread once
+        # for the whole payload
+        chunk_size = self._print_chunk_size
+        image_view = memoryview(image_data)
+        self._client.outbound_q.put(tuple(
+            image_view[start:start + chunk_size]
+            for start in range(0, image_length, chunk_size)
+        ))
 
-        logger.debug("Image data queued, waiting for transfer...")
+        # Once per print call, so INFO rather than per-chunk DEBUG
+        logger.info("Image data queued, waiting for transfer...")
 
         # Wait for transfer completion
         self._receive_message(transfer_timeout)
@@ -198,42 +221,40 @@ class CanonIvy2Printer(Printer):
 
     def get_status(self) -> PrinterStatus:
         """Get current printer status."""
-        error_code, battery, usb, cover_open, no_paper, wrong_sheet = self._perform_task(
-            GetStatusTask()
-        )
+        status = self._perform_task(GetStatusTask())
 
         # Determine error message
         error = None
-        if cover_open:
+        if status.is_cover_open:
             error = "Cover is open"
-        elif no_paper:
+        elif status.is_no_paper:
             error = "No paper"
-        elif wrong_sheet:
+        elif status.is_wrong_smart_sheet:
             error = "Wrong smart sheet"
-        elif error_code != 0:
-            error = f"Error code: {error_code}"
+        elif status.error_code != 0:
+            error = f"Error code: {status.error_code}"
 
-        is_ready = error is None and battery >= PRINT_BATTERY_MIN
+        is_ready = error is None and status.battery_level >= PRINT_BATTERY_MIN
 
         return PrinterStatus(
-            battery_level=battery,
+            battery_level=status.battery_level,
             is_ready=is_ready,
             error=error,
-            is_cover_open=cover_open,
+            is_cover_open=status.is_cover_open,
         )
 
     def get_settings(self) -> Dict[str, Any]:
         """Get printer settings."""
-        auto_off, firmware, tmd, photos, color = self._perform_task(GetSettingTask())
+        settings = self._perform_task(GetSettingTask())
 
-        self._firmware_version = firmware
+        self._firmware_version = settings.firmware_version
 
         return {
-            "auto_power_off": auto_off,
-            "firmware_version": firmware,
-            "tmd_version": tmd,
-            "photos_printed": photos,
-            "color_id": color,
+            "auto_power_off": settings.auto_power_off,
+            "firmware_version": settings.firmware_version,
+            "tmd_version": settings.tmd_version,
+            "photos_printed": settings.photos_printed,
+            "color_id": settings.color_id,
         }
 
     def set_setting(self, key: str, value: Any) -> None:
@@ -281,41 +302,50 @@ class CanonIvy2Printer(Printer):
 
     def _perform_task(self, task: BaseTask):
         """Execute a protocol task and return the result."""
-        self._send_message(task.get_message())
-        response = self._receive_message()
-
-        if response.ack != task.ack:
-            raise ProtocolError(
-                f"Unexpected ACK: expected {task.ack}, got {response.ack}",
-                expected=task.ack,
-                got=response.ack,
-            )
+        return self._perform_tasks([task])[0]
+
+    def _perform_tasks(self, tasks):
+        """Execute several tasks pipelined over the link.
+
+        Every request is sent back-to-back, then the responses are
+        collected and validated in order, so N tasks cost roughly one
+        round trip instead of N.
+        """
+        for task in tasks:
+            self._send_message(task.get_message())
 
-        return task.process_response(response)
+        results = []
+        for task in tasks:
+            response = self._receive_message()
+
+            if response.ack != task.ack:
+                raise ProtocolError(
+                    f"Unexpected ACK: expected {task.ack}, got {response.ack}",
+                    expected=task.ack,
+                    got=response.ack,
+                )
+
+            results.append(task.process_response(response))
+
+        return results
 
     def _send_message(self, message: bytes) -> None:
         """Send a message via the client queue."""
         if not self.is_connected:
             raise ConnectionError("Not connected")
 
-        self._client.outbound_q.put(message)
+        self._runner.send(message)
 
     def _receive_message(self, timeout: int = 5):
         """Wait for and parse a response message."""
-        start = time.time()
-
-        while time.time() < start + timeout:
-            if not self.is_connected:
-                raise ConnectionError("Connection lost")
-
-            try:
-                data = self._client.inbound_q.get(timeout=0.1)
-                response = parse_message(data)
-
-                logger.debug(f"Received: ack={response.ack}, error={response.error}")
-                return response
-
-            except queue.Empty:
-                continue
-
-        raise TimeoutError(f"No response within {timeout} seconds")
+        if not self.is_connected:
+            raise ConnectionError("Connection lost")
+
+        response = self._runner.receive(timeout)
+        # Lazy so per-chunk transfer ACKs cost nothing when DEBUG is off
+        logger.opt(lazy=True).debug(
+            "Received: ack={}, error={}",
+            lambda: response.ack,
+            lambda: response.error,
+        )
+        return response
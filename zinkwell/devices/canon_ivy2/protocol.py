@@ -11,6 +11,7 @@ Protocol details:
 
 import struct
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional
 
 # Protocol constants
@@ -31,6 +32,13 @@ ACK_SETTING_ACCESSORY = 259
 ACK_PRINT_READY = 769
 ACK_REBOOT = 65535
 
+# ACK (bytes 5-6, big-endian) and error (byte 7) of an inbound message;
+# compiled once so the per-message parse is a single C call
+_ACK_ERROR_STRUCT = struct.Struct(">5xHB")
+
+# Outbound header: start code, b1, b2, command, write flag
+_HEADER_STRUCT = struct.Struct(">HhbHB")
+
 
 def parse_bit_range(value: int, size: int) -> int:
     """Extract a range of bits from a value.
@@ -42,14 +50,32 @@ def parse_bit_range(value: int, size: int) -> int:
     Returns:
         Extracted integer value.
     """
-    bits = ""
-    for i in range(size):
-        bits += "1" if ((value >> i) & 1) == 1 else "0"
+    # Equivalent to masking off the low `size` bits; the mask form
+    # avoids building and re-parsing a binary string per call
+    return value & ((1 << size) - 1)
+
+
+@dataclass(frozen=True)
+class StatusInfo:
+    """Decoded status response fields."""
+
+    error_code: int
+    battery_level: int
+    usb_status: int
+    is_cover_open: bool
+    is_no_paper: bool
+    is_wrong_smart_sheet: bool
+
+
+@dataclass(frozen=True)
+class SettingsInfo:
+    """Decoded settings response fields."""
 
-    try:
-        return int(bits[::-1], 2)
-    except ValueError:
-        return 0
+    auto_power_off: int
+    firmware_version: str
+    tmd_version: int
+    photos_printed: int
+    color_id: int
 
 
 @dataclass
@@ -71,13 +97,11 @@ def parse_message(data: bytes) -> ParsedMessage:
     Returns:
         ParsedMessage with extracted fields.
     """
-    payload = data[8:]
-    ack = (data[6] & 255) | ((data[5] & 255) << 8)
-    error = data[7] & 255
+    ack, error = _ACK_ERROR_STRUCT.unpack_from(data)
 
     return ParsedMessage(
         raw_data=data,
-        payload=payload,
+        payload=data[8:],
         ack=ack,
         error=error,
     )
@@ -94,12 +118,23 @@ def build_base_message(command: int, flag_1: bool = False, flag_2: bool = False)
     Returns:
         34-byte message buffer.
     """
+    return bytearray(_base_message_bytes(command, flag_1, flag_2))
+
+
+@lru_cache(maxsize=16)
+def _base_message_bytes(command: int, flag_1: bool, flag_2: bool) -> bytes:
+    """Immutable 34-byte header template, cached per (command, flags).
+
+    Only a handful of command/flag combinations exist, so each header
+    is packed once and later builds copy the cached bytes instead of
+    re-running struct.pack_into. Tasks with constant bodies can use
+    the cached bytes directly without the bytearray copy.
+    """
     b1 = -1 if flag_1 else 1
     b2 = -1 if flag_1 else 32
 
     message = bytearray(PACKET_SIZE)
-    struct.pack_into(
-        ">HhbHB",
+    _HEADER_STRUCT.pack_into(
         message,
         0,
         START_CODE,
@@ -109,7 +144,7 @@ def build_base_message(command: int, flag_1: bool = False, flag_2: bool = False)
         1 if flag_2 else 0,
     )
 
-    return message
+    return bytes(message)
 
 
 # Task classes for each command type
@@ -135,7 +170,7 @@ class StartSessionTask(BaseTask):
     ack = ACK_START_SESSION
 
     def get_message(self) -> bytes:
-        return bytes(build_base_message(COMMAND_START_SESSION, flag_1=True, flag_2=False))
+        return _base_message_bytes(COMMAND_START_SESSION, True, False)
 
     def process_response(self, response: ParsedMessage) -> Tuple[int, int]:
         """Parse session response.
@@ -156,28 +191,27 @@ class GetStatusTask(BaseTask):
     ack = ACK_GET_STATUS
 
     def get_message(self) -> bytes:
-        return bytes(build_base_message(COMMAND_GET_STATUS))
+        return _base_message_bytes(COMMAND_GET_STATUS, False, False)
 
-    def process_response(self, response: ParsedMessage) -> Tuple[int, int, int, bool, bool, bool]:
+    def process_response(self, response: ParsedMessage) -> StatusInfo:
         """Parse status response.
 
         Returns:
-            Tuple of (error_code, battery_level, usb_status,
-                      is_cover_open, is_no_paper, is_wrong_smart_sheet).
+            StatusInfo with the decoded fields.
         """
         payload = response.payload
 
         i = (payload[0] << 8) | payload[1]
-        error_code = payload[2]
-        battery_level = parse_bit_range(i, 6)
-        usb_status = (i >> 7) & 1
-
         queue_flags = ((payload[4] & 255) << 8) | (payload[5] & 255)
-        is_cover_open = (queue_flags & 1) == 1
-        is_no_paper = (queue_flags & 2) == 2
-        is_wrong_smart_sheet = (queue_flags & 16) == 16
 
-        return error_code, battery_level, usb_status, is_cover_open, is_no_paper, is_wrong_smart_sheet
+        return StatusInfo(
+            error_code=payload[2],
+            battery_level=parse_bit_range(i, 6),
+            usb_status=(i >> 7) & 1,
+            is_cover_open=(queue_flags & 1) == 1,
+            is_no_paper=(queue_flags & 2) == 2,
+            is_wrong_smart_sheet=(queue_flags & 16) == 16,
+        )
 
 
 class GetSettingTask(BaseTask):
@@ -186,24 +220,23 @@ class GetSettingTask(BaseTask):
     ack = ACK_SETTING_ACCESSORY
 
     def get_message(self) -> bytes:
-        return bytes(build_base_message(COMMAND_SETTING_ACCESSORY))
+        return _base_message_bytes(COMMAND_SETTING_ACCESSORY, False, False)
 
-    def process_response(self, response: ParsedMessage) -> Tuple[int, str, int, int, int]:
+    def process_response(self, response: ParsedMessage) -> SettingsInfo:
         """Parse settings response.
 
         Returns:
-            Tuple of (auto_power_off, firmware_version, tmd_version,
-                      number_of_photos_printed, color_id).
+            SettingsInfo with the decoded fields.
         """
         payload = response.payload
 
-        auto_power_off = payload[0]
-        firmware_version = f"{payload[1]}.{payload[2]}.{payload[3]}"
-        tmd_version = payload[5]
-        number_of_photos_printed = (payload[6] << 8) | payload[7]
-        color_id = payload[8]
-
-        return auto_power_off, firmware_version, tmd_version, number_of_photos_printed, color_id
+        return SettingsInfo(
+            auto_power_off=payload[0],
+            firmware_version=f"{payload[1]}.{payload[2]}.{payload[3]}",
+            tmd_version=payload[5],
+            photos_printed=(payload[6] << 8) | payload[7],
+            color_id=payload[8],
+        )
 
 
 class SetSettingTask(BaseTask):
@@ -1,7 +1,5 @@
 """Kodak Step printer implementation."""
 
-import queue
-import time
 from typing import Any, Dict, Optional, Union
 
 from loguru import logger
@@ -9,7 +7,7 @@ from loguru import logger
 from ..base import Printer
 from ...models import PrinterStatus, PrinterInfo, PrinterCapabilities
 from ...bluetooth import get_transport, BluetoothTransport
-from ...utils import ThreadedClient
+from ...utils import TaskRunner, ThreadedClient
 from ...exceptions import (
     ConnectionError,
     PrintError,
@@ -17,13 +15,11 @@ from ...exceptions import (
     LowBatteryError,
     CoverOpenError,
     NoPaperError,
-    TimeoutError,
 )
 
 from .protocol import (
     PACKET_SIZE,
     CHUNK_SIZE,
-    INTER_CHUNK_DELAY_MS,
     MIN_BATTERY_LEVEL,
     ERR_SUCCESS,
     ERR_NO_PAPER,
@@ -42,6 +38,21 @@ from .protocol import (
 from .image import prepare_image
 
 
+def _parse(data: bytes):
+    """Parse an inbound frame, mapping bad frames to ProtocolError."""
+    try:
+        return parse_response(data)
+    except ValueError as e:
+        raise ProtocolError(str(e))
+
+
+# Stateless tasks are reusable; one instance each is enough
+_BATTERY_TASK = GetBatteryLevelTask()
+_PAGE_TYPE_TASK = GetPageTypeTask()
+_PRINT_COUNT_TASK = GetPrintCountTask()
+_AUTO_POWER_OFF_TASK = GetAutoPowerOffTask()
+
+
 class KodakStepPrinter(Printer):
     """Kodak Step Series Mini Photo Printer.
 
@@ -83,6 +94,7 @@ class KodakStepPrinter(Printer):
         port: int = 1,
         transport: Optional[Union[str, BluetoothTransport]] = None,
         is_slim: bool = False,
+        chunk_size: Optional[int] = None,
     ):
         """Initialize Kodak Step printer.
 
@@ -92,10 +104,15 @@ class KodakStepPrinter(Printer):
             transport: Transport type ("native", "pybluez"), transport instance,
                 or None for auto-detection.
             is_slim: True for Step Slim or Snap 2 devices.
+            chunk_size: Transfer chunk size in bytes (default CHUNK_SIZE).
+                The Kodak protocol does not negotiate an MTU, so this is
+                the tuning knob for transfer experiments.
         """
         self._address = address
         self._port = port
         self._is_slim = is_slim
+        self._print_chunk_size = chunk_size or CHUNK_SIZE
+        self._accessory_task = GetAccessoryInfoTask(is_slim=is_slim)
         # Store transport instance or type string
         if isinstance(transport, BluetoothTransport):
             self._transport_instance = transport
@@ -104,6 +121,7 @@ class KodakStepPrinter(Printer):
             self._transport_instance = None
             self._transport_type = transport
         self._client: Optional[ThreadedClient] = None
+        self._runner: Optional[TaskRunner] = None
         self._battery_level: int = 0
         self._is_charging: bool = False
 
@@ -131,11 +149,11 @@ class KodakStepPrinter(Printer):
         if self.is_connected:
             return
 
-        # Use provided transport instance or create one
-        if self._transport_instance is not None:
-            transport = self._transport_instance
-        else:
-            transport = get_transport(self._transport_type)
+        # Use provided transport instance, or create one on first use and
+        # keep it so reconnects reuse the same transport
+        if self._transport_instance is None:
+            self._transport_instance = get_transport(self._transport_type)
+        transport = self._transport_instance
 
         self._client = ThreadedClient(
             transport,
@@ -143,24 +161,21 @@ class KodakStepPrinter(Printer):
             auto_disconnect_timeout=30,
         )
         self._client.connect(self._address, self._port)
+        self._runner = TaskRunner(self._client, _parse)
 
         # Initialize session with GET_ACCESSORY_INFO
-        battery_level, is_charging = self._perform_task(
-            GetAccessoryInfoTask(is_slim=self._is_slim)
-        )
+        battery_level, is_charging = self._perform_task(self._accessory_task)
         self._battery_level = battery_level
         self._is_charging = is_charging
 
-        logger.debug(f"Connected to Kodak Step; Battery: {battery_level}%")
-
-        # Required delay after initialization
-        time.sleep(0.5)
+        logger.debug("Connected to Kodak Step; Battery: {}%", battery_level)
 
     def disconnect(self) -> None:
         """Disconnect from the printer."""
         if self._client is not None:
             self._client.disconnect()
             self._client = None
+            self._runner = None
 
     def print(
         self,
@@ -174,7 +189,8 @@ class KodakStepPrinter(Printer):
         """Print an image.
 
         Args:
-            image_path: Path to image file.
+            image_path: Path to image file, or already-prepared image
+                data as a bytes-like object (sent as-is).
             auto_crop: If True, crop to fill. If False, fit with letterboxing.
             quality: JPEG quality (1-100).
             copies: Number of copies to print (1-255).
@@ -187,8 +203,11 @@ class KodakStepPrinter(Printer):
             CoverOpenError: If cover is open.
             NoPaperError: If no paper.
         """
-        # Prepare image data
-        image_data = prepare_image(image_path, auto_crop=auto_crop, quality=quality)
+        # Prepare image data; bytes-like input skips re-preparation
+        if isinstance(image_path, (bytes, bytearray, memoryview)):
+            image_data = image_path
+        else:
+            image_data = prepare_image(image_path, auto_crop=auto_crop, quality=quality)
         image_length = len(image_data)
 
         # Check printer is ready
@@ -199,38 +218,31 @@ class KodakStepPrinter(Printer):
         if error_code != ERR_SUCCESS:
             raise PrintError(get_error_message(error_code), device_error=str(error_code))
 
-        # Required delay after PRINT_READY
-        time.sleep(0.1)
-
-        # Send image data in chunks
-        start_index = 0
-        while start_index < image_length:
-            end_index = min(start_index + CHUNK_SIZE, image_length)
-            chunk = image_data[start_index:end_index]
-            self._client.outbound_q.put(chunk)
-            start_index = end_index
-
-            # Inter-chunk delay
-            time.sleep(INTER_CHUNK_DELAY_MS / 1000.0)
+        # Send image data as one batch of zero-copy views into the
+        # image buffer - a single enqueue wakes the client thread once
+        # for the whole payload; pacing is left to the transport writer
+        chunk_size = self._print_chunk_size
+        image_view = memoryview(image_data)
+        self._client.outbound_q.put(tuple(
+            image_view[start:start + chunk_size]
+            for start in range(0, image_length, chunk_size)
+        ))
 
-        logger.debug("Image data queued, printer should start printing...")
+        # Once per print call, so INFO rather than per-chunk DEBUG
+        logger.info("Image data queued, printer should start printing...")
 
     def get_status(self) -> PrinterStatus:
         """Get current printer status."""
         # Get battery from accessory info
-        battery_level, is_charging = self._perform_task(
-            GetAccessoryInfoTask(is_slim=self._is_slim)
-        )
+        battery_level, is_charging = self._perform_task(self._accessory_task)
         self._battery_level = battery_level
 
         # Check charging status
-        is_charging = self._perform_task(GetBatteryLevelTask())
+        is_charging = self._perform_task(_BATTERY_TASK)
         self._is_charging = is_charging
 
-        time.sleep(0.1)
-
         # Check paper status
-        paper_error = self._perform_task(GetPageTypeTask())
+        paper_error = self._perform_task(_PAGE_TYPE_TASK)
 
         # Determine error message
         error = None
@@ -256,11 +268,10 @@ class KodakStepPrinter(Printer):
     def get_settings(self) -> Dict[str, Any]:
         """Get printer settings."""
         # Get auto power-off setting
-        auto_off = self._perform_task(GetAutoPowerOffTask())
-        time.sleep(0.1)
+        auto_off = self._perform_task(_AUTO_POWER_OFF_TASK)
 
         # Get print count
-        print_count = self._perform_task(GetPrintCountTask())
+        print_count = self._perform_task(_PRINT_COUNT_TASK)
 
         return {
             "auto_power_off": auto_off,
@@ -289,7 +300,11 @@ class KodakStepPrinter(Printer):
     def _perform_task(self, task: BaseTask):
         """Execute a protocol task and return the result."""
         self._send_message(task.get_message())
-        response = self._receive_message()
+        # Match on the command byte so a stale frame from an earlier
+        # exchange cannot be mistaken for this task's response
+        response = self._receive_message(
+            match=lambda r: r.command == task.command
+        )
 
         return task.process_response(response)
 
@@ -298,28 +313,18 @@ class KodakStepPrinter(Printer):
         if not self.is_connected:
             raise ConnectionError("Not connected")
 
-        self._client.outbound_q.put(message)
+        self._runner.send(message)
 
-    def _receive_message(self, timeout: int = 5):
+    def _receive_message(self, timeout: int = 5, match=None):
         """Wait for and parse a response message."""
-        start = time.time()
-
-        while time.time() < start + timeout:
-            if not self.is_connected:
-                raise ConnectionError("Connection lost")
-
-            try:
-                data = self._client.inbound_q.get(timeout=0.1)
-                response = parse_response(data)
-
-                logger.debug(
-                    f"Received: cmd={response.command}, error={response.error_code}"
-                )
-                return response
-
-            except queue.Empty:
-                continue
-            except ValueError as e:
-                raise ProtocolError(str(e))
-
-        raise TimeoutError(f"No response within {timeout} seconds")
+        if not self.is_connected:
+            raise ConnectionError("Connection lost")
+
+        response = self._runner.receive(timeout, match=match)
+        # Lazy so per-message logging costs nothing when DEBUG is off
+        logger.opt(lazy=True).debug(
+            "Received: cmd={}, error={}",
+            lambda: response.command,
+            lambda: response.error_code,
+        )
+        return response
@@ -9,6 +9,7 @@ Protocol details:
 - Commands and responses use same header structure
 """
 
+import struct
 from dataclasses import dataclass
 from typing import Tuple, Optional
 
@@ -21,6 +22,12 @@ MIN_BATTERY_LEVEL = 30
 # Header bytes
 HEADER = bytes([0x1B, 0x2A, 0x43, 0x41])  # ESC * C A
 
+# Zeroed packet with the header pre-applied; copied per build_packet call
+_PACKET_TEMPLATE = HEADER + bytes(PACKET_SIZE - 4)
+
+# Compiled once for the 16-bit big-endian print count field
+_PRINT_COUNT_STRUCT = struct.Struct(">H")
+
 # Command codes (byte 6)
 CMD_PRINT_READY = 0x00
 CMD_GET_ACCESSORY_INFO = 0x01
@@ -94,8 +101,7 @@ def build_packet(
     Returns:
         34-byte packet buffer.
     """
-    packet = bytearray(PACKET_SIZE)
-    packet[0:4] = HEADER
+    packet = bytearray(_PACKET_TEMPLATE)
     packet[4] = flags1
     packet[5] = flags2
     packet[6] = command
@@ -173,6 +179,12 @@ class GetAccessoryInfoTask(BaseTask):
 
     command = CMD_GET_ACCESSORY_INFO
 
+    # Only two variants exist; both are built once at class definition
+    _MESSAGES = {
+        False: bytes(build_packet(CMD_GET_ACCESSORY_INFO, flags2=FLAG_STANDARD_DEVICE)),
+        True: bytes(build_packet(CMD_GET_ACCESSORY_INFO, flags2=FLAG_SLIM_DEVICE)),
+    }
+
     def __init__(self, is_slim: bool = False):
         """Initialize task.
 
@@ -182,9 +194,7 @@ class GetAccessoryInfoTask(BaseTask):
         self.is_slim = is_slim
 
     def get_message(self) -> bytes:
-        flags2 = FLAG_SLIM_DEVICE if self.is_slim else FLAG_STANDARD_DEVICE
-        packet = build_packet(CMD_GET_ACCESSORY_INFO, flags2=flags2)
-        return bytes(packet)
+        return self._MESSAGES[self.is_slim]
 
     def process_response(self, response: ParsedResponse) -> Tuple[int, bool]:
         """Parse accessory info response.
@@ -208,9 +218,11 @@ class GetBatteryLevelTask(BaseTask):
 
     command = CMD_GET_BATTERY_LEVEL
 
+    # Message is constant; built once at class definition
+    MESSAGE = bytes(build_packet(CMD_GET_BATTERY_LEVEL))
+
     def get_message(self) -> bytes:
-        packet = build_packet(CMD_GET_BATTERY_LEVEL)
-        return bytes(packet)
+        return self.MESSAGE
 
     def process_response(self, response: ParsedResponse) -> bool:
         """Parse battery level response.
@@ -227,9 +239,11 @@ class GetPageTypeTask(BaseTask):
 
     command = CMD_GET_PAGE_TYPE
 
+    # Message is constant; built once at class definition
+    MESSAGE = bytes(build_packet(CMD_GET_PAGE_TYPE))
+
     def get_message(self) -> bytes:
-        packet = build_packet(CMD_GET_PAGE_TYPE)
-        return bytes(packet)
+        return self.MESSAGE
 
     def process_response(self, response: ParsedResponse) -> int:
         """Parse page type response.
@@ -245,10 +259,11 @@ class GetPrintCountTask(BaseTask):
 
     command = CMD_PRINT_READY  # Uses same command byte as PRINT_READY
 
+    # Distinguished from PRINT_READY by byte 7 = 0x01; built once
+    MESSAGE = bytes(build_packet(CMD_PRINT_READY, flags3=0x01))
+
     def get_message(self) -> bytes:
-        # Distinguished from PRINT_READY by byte 7 = 0x01
-        packet = build_packet(CMD_PRINT_READY, flags3=0x01)
-        return bytes(packet)
+        return self.MESSAGE
 
     def process_response(self, response: ParsedResponse) -> int:
         """Parse print count response.
@@ -257,7 +272,7 @@ class GetPrintCountTask(BaseTask):
             Total number of prints.
         """
         # Print count is 16-bit big-endian in bytes 8-9
-        return (response.raw_data[8] << 8) | response.raw_data[9]
+        return _PRINT_COUNT_STRUCT.unpack_from(response.raw_data, 8)[0]
 
 
 class GetAutoPowerOffTask(BaseTask):
@@ -265,9 +280,11 @@ class GetAutoPowerOffTask(BaseTask):
 
     command = CMD_GET_AUTO_POWER_OFF
 
+    # Message is constant; built once at class definition
+    MESSAGE = bytes(build_packet(CMD_GET_AUTO_POWER_OFF))
+
     def get_message(self) -> bytes:
-        packet = build_packet(CMD_GET_AUTO_POWER_OFF)
-        return bytes(packet)
+        return self.MESSAGE
 
     def process_response(self, response: ParsedResponse) -> int:
         """Parse auto power-off response.
@@ -1,5 +1,7 @@
 """Utility modules."""
 
+from .aio import AsyncClient
+from .protocol import TaskRunner
 from .threading import ThreadedClient
 
-__all__ = ["ThreadedClient"]
+__all__ = ["AsyncClient", "TaskRunner", "ThreadedClient"]
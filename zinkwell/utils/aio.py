@@ -0,0 +1,135 @@
+"""Asyncio-based client for Bluetooth transports.
+
+An event-loop alternative to ThreadedClient: one loop thread can drive
+many connections (e.g. probing several ports at once) without a
+dedicated OS thread and poll loop per connection, and the inactivity
+timer is a loop callback instead of a threading.Timer.
+"""
+
+import asyncio
+import socket
+from typing import Optional
+
+from loguru import logger
+
+from ..exceptions import ConnectionError as ZinkwellConnectionError
+
+
+class AsyncClient:
+    """Asyncio stream wrapper around a Bluetooth RFCOMM socket.
+
+    Example:
+        async def main():
+            client = AsyncClient()
+            await client.connect("AA:BB:CC:DD:EE:FF", 1)
+
+            await client.send(message_bytes)
+            response = await client.recv(4096)
+
+            await client.disconnect()
+    """
+
+    def __init__(self, auto_disconnect_timeout: int = 30):
+        """Initialize the async client.
+
+        Args:
+            auto_disconnect_timeout: Seconds of inactivity before
+                auto-disconnect.
+        """
+        self.auto_disconnect_timeout = auto_disconnect_timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._disconnect_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(
+        self,
+        address: str,
+        port: int,
+        sock: Optional[socket.socket] = None,
+    ) -> None:
+        """Connect and set up the stream pair.
+
+        Args:
+            address: Bluetooth MAC address.
+            port: RFCOMM channel.
+            sock: Already-connected socket to adopt instead of opening a
+                new RFCOMM connection (used in tests).
+
+        Raises:
+            ConnectionError: If connection fails.
+        """
+        loop = asyncio.get_running_loop()
+
+        if sock is None:
+            sock = socket.socket(
+                socket.AF_BLUETOOTH,
+                socket.SOCK_STREAM,
+                socket.BTPROTO_RFCOMM,
+            )
+            sock.setblocking(False)
+            try:
+                await loop.sock_connect(sock, (address, port))
+            except OSError as e:
+                sock.close()
+                raise ZinkwellConnectionError(
+                    f"Failed to connect to {address}:{port}: {e}"
+                ) from e
+
+        self._reader, self._writer = await asyncio.open_connection(sock=sock)
+        self._reset_disconnect_timer()
+        logger.debug(f"Async client connected to {address}:{port}")
+
+    async def disconnect(self) -> None:
+        """Close the connection."""
+        if self._disconnect_handle is not None:
+            self._disconnect_handle.cancel()
+            self._disconnect_handle = None
+
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass  # Ignore errors on close
+            finally:
+                self._reader = None
+                self._writer = None
+
+    async def send(self, data: bytes) -> None:
+        """Send data, refreshing the inactivity timer.
+
+        Raises:
+            ConnectionError: If not connected.
+        """
+        if not self.is_connected:
+            raise ZinkwellConnectionError("Not connected")
+
+        self._writer.write(data)
+        await self._writer.drain()
+        self._reset_disconnect_timer()
+
+    async def recv(self, size: int) -> bytes:
+        """Receive up to size bytes.
+
+        Raises:
+            ConnectionError: If not connected.
+        """
+        if self._reader is None:
+            raise ZinkwellConnectionError("Not connected")
+
+        return await self._reader.read(size)
+
+    def _reset_disconnect_timer(self) -> None:
+        """Re-arm the auto-disconnect callback on the event loop."""
+        if self._disconnect_handle is not None:
+            self._disconnect_handle.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._disconnect_handle = loop.call_later(
+            self.auto_disconnect_timeout,
+            lambda: asyncio.ensure_future(self.disconnect()),
+        )
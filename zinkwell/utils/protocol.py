@@ -0,0 +1,112 @@
+"""Shared protocol task execution.
+
+Both device implementations used to carry their own copies of the
+send/receive/perform-task loop. TaskRunner is the single implementation
+they now share: one place to hold the blocking-get receive loop, the
+monotonic deadline handling, and the connection checks.
+"""
+
+import queue
+import time
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+from ..exceptions import ConnectionError, TimeoutError
+from .threading import ThreadedClient
+
+
+class TaskRunner:
+    """Runs protocol tasks against a ThreadedClient.
+
+    A task is any object with get_message() and process_response();
+    parse turns raw inbound bytes into the device's response object.
+    """
+
+    def __init__(self, client: ThreadedClient, parse: Callable[[bytes], Any]):
+        self.client = client
+        self.parse = parse
+
+    # Seconds to wait for outbound queue space before concluding the
+    # transport is wedged
+    _SEND_TIMEOUT = 5
+
+    def send(self, message: bytes) -> None:
+        """Queue a message, failing fast if the client is gone.
+
+        The outbound queue is bounded; a full queue means the transport
+        has stopped draining. One throttled retry is attempted before
+        giving up.
+
+        Raises:
+            ConnectionError: If the client thread is not running or the
+                transport is not draining outbound messages.
+        """
+        if not self.client.alive.is_set():
+            raise ConnectionError("Not connected")
+
+        try:
+            self.client.outbound_q.put(message, timeout=self._SEND_TIMEOUT)
+        except queue.Full:
+            logger.warning("Outbound queue full; transport may be stalled")
+            try:
+                self.client.outbound_q.put(message, timeout=self._SEND_TIMEOUT)
+            except queue.Full:
+                raise ConnectionError("Transport not draining outbound messages")
+
+    def receive(
+        self,
+        timeout: int = 5,
+        match: Optional[Callable[[Any], bool]] = None,
+    ):
+        """Wait for the next inbound message and parse it.
+
+        Args:
+            timeout: Seconds to wait for a message.
+            match: Optional predicate over the parsed response. Frames
+                that fail it - e.g. a stale reply left over from an
+                exchange that timed out - are dropped instead of being
+                mistaken for the awaited response.
+
+        Raises:
+            ConnectionError: If the connection drops while waiting.
+            TimeoutError: If no matching message arrives within timeout
+                seconds.
+        """
+        deadline = time.monotonic() + timeout
+
+        while True:
+            if not self.client.alive.is_set():
+                raise ConnectionError("Connection lost")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                # Block on the queue, capping the wait so the connection
+                # state is still checked periodically
+                data = self.client.inbound_q.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                continue
+
+            response = self.parse(data)
+            if match is not None and not match(response):
+                logger.debug("Dropping stale inbound frame")
+                continue
+
+            return response
+
+        raise TimeoutError(f"No response within {timeout} seconds")
+
+    def perform(
+        self,
+        task,
+        timeout: int = 5,
+        match: Optional[Callable[[Any], bool]] = None,
+    ):
+        """Send a task's message and process the printer's response."""
+        self.send(task.get_message())
+        response = self.receive(timeout, match=match)
+
+        return task.process_response(response)
@@ -19,7 +19,7 @@ class ThreadedClient(threading.Thread):
     Provides:
     - Background thread for non-blocking I/O
     - Inbound/outbound message queues
-    - Auto-disconnect timer
+    - Auto-disconnect after inactivity
     - Connection state management
 
     Devices that need threaded I/O can use this directly.
@@ -42,11 +42,18 @@ class ThreadedClient(threading.Thread):
         client.disconnect()
     """
 
+    # Max consecutive recv() calls per loop iteration
+    _MAX_RECV_BURST = 32
+
+    # Max bytes coalesced into a single outbound write
+    _MAX_COALESCE_BYTES = 4096
+
     def __init__(
         self,
         transport: BluetoothTransport,
         receive_size: int = 4096,
         auto_disconnect_timeout: int = 30,
+        queue_size: int = 32,
     ):
         """Initialize the threaded client.
 
@@ -54,6 +61,9 @@ class ThreadedClient(threading.Thread):
             transport: Bluetooth transport to wrap.
             receive_size: Buffer size for receiving data.
             auto_disconnect_timeout: Seconds of inactivity before auto-disconnect.
+            queue_size: Max queued outbound items before put blocks,
+                so a stalled transport pushes back on producers instead
+                of buffering without bound.
         """
         super().__init__(daemon=True)
 
@@ -62,9 +72,18 @@ class ThreadedClient(threading.Thread):
         self.auto_disconnect_timeout = auto_disconnect_timeout
 
         self.alive = threading.Event()
-        self.outbound_q: queue.Queue[bytes] = queue.Queue()
-        self.inbound_q: queue.Queue[bytes] = queue.Queue()
-        self._disconnect_timer: Optional[threading.Timer] = None
+        # Outbound items are bytes-like messages, or a tuple/list of
+        # them enqueued as one batch
+        self.outbound_q: queue.Queue = queue.Queue(maxsize=queue_size)
+        # Inbound is a strict single-producer/single-consumer handoff;
+        # SimpleQueue skips Queue's task-tracking machinery
+        self.inbound_q: queue.SimpleQueue[bytes] = queue.SimpleQueue()
+
+        # Inactivity deadline for auto-disconnect (monotonic clock)
+        self._deadline = time.monotonic() + auto_disconnect_timeout
+
+        # Reusable receive buffer - avoids a fresh allocation per recv
+        self._rx_buffer = bytearray(receive_size)
 
     def connect(self, address: str, port: int) -> None:
         """Connect and start the I/O thread.
@@ -75,7 +94,7 @@ class ThreadedClient(threading.Thread):
         """
         self.transport.connect(address, port)
         self.alive.set()
-        self._reset_disconnect_timer()
+        self._deadline = time.monotonic() + self.auto_disconnect_timeout
         self.start()
 
     def disconnect(self, timeout: Optional[float] = None) -> None:
@@ -85,11 +104,6 @@ class ThreadedClient(threading.Thread):
             timeout: Max time to wait for thread to stop.
         """
         self.alive.clear()
-
-        if self._disconnect_timer is not None:
-            self._disconnect_timer.cancel()
-            self._disconnect_timer = None
-
         self.transport.disconnect()
 
         try:
@@ -105,39 +119,69 @@ class ThreadedClient(threading.Thread):
                 if not self.transport.is_connected():
                     break
 
+                # Auto-disconnect after sustained inactivity
+                remaining = self._deadline - time.monotonic()
+                if remaining <= 0:
+                    self.disconnect()
+                    break
+
                 # Send outbound messages (blocking with short timeout)
                 self.transport.set_blocking(True)
                 try:
-                    message = self.outbound_q.get(timeout=0.1)
-                    self.transport.send(message)
-                    self._reset_disconnect_timer()
-                    time.sleep(0.02)  # Small delay between sends
+                    message = self.outbound_q.get(timeout=min(remaining, 0.1))
+                    batch = None
+                    if isinstance(message, (tuple, list)):
+                        # A whole payload enqueued as one item - the
+                        # producer paid one lock acquisition and one
+                        # wakeup for all of its chunks
+                        batch = message
+                        message = None
+                    elif not self.outbound_q.empty():
+                        # Coalesce any further queued messages into a
+                        # single write to amortize per-frame overhead on
+                        # bursts of small messages. A lone message is
+                        # sent as-is, with no intermediate copy.
+                        parts = [message]
+                        total = len(message)
+                        while total < self._MAX_COALESCE_BYTES:
+                            try:
+                                part = self.outbound_q.get_nowait()
+                            except queue.Empty:
+                                break
+                            if isinstance(part, (tuple, list)):
+                                # Batches stay out of the coalesce
+                                # buffer; written after it, in order
+                                batch = part
+                                break
+                            parts.append(part)
+                            total += len(part)
+                        if len(parts) > 1:
+                            message = b"".join(parts)
+                    if message is not None:
+                        self.transport.send(message)
+                    if batch is not None:
+                        # Each part goes straight to the wire without
+                        # re-entering the queue lock
+                        for part in batch:
+                            self.transport.send(part)
+                    self._deadline = time.monotonic() + self.auto_disconnect_timeout
                 except queue.Empty:
                     pass
 
-                # Receive inbound messages (non-blocking)
+                # Drain inbound data already available (non-blocking,
+                # bounded burst so sends are never starved)
                 self.transport.set_blocking(False)
-                try:
-                    data = self.transport.recv(self.receive_size)
-                    if data:
-                        self.inbound_q.put(data)
-                except (OSError, BlockingIOError):
-                    pass  # No data available
+                for _ in range(self._MAX_RECV_BURST):
+                    try:
+                        received = self.transport.recv_into(self._rx_buffer)
+                    except (OSError, BlockingIOError):
+                        break  # No data available
+                    if not received:
+                        break
+                    self.inbound_q.put(bytes(memoryview(self._rx_buffer)[:received]))
         except (TransportError, ZinkwellConnectionError, OSError):
             # Transport error (e.g., Bluetooth drop) - trigger clean shutdown
             pass
         finally:
             # Always clear alive flag so callers see the failure
             self.alive.clear()
-
-    def _reset_disconnect_timer(self) -> None:
-        """Reset the auto-disconnect timer."""
-        if self._disconnect_timer is not None:
-            self._disconnect_timer.cancel()
-
-        self._disconnect_timer = threading.Timer(
-            self.auto_disconnect_timeout,
-            self.disconnect,
-        )
-        self._disconnect_timer.daemon = True
-        self._disconnect_timer.start()